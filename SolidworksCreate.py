@@ -25,13 +25,172 @@ Usage:
     sw.create_cube(size=0.02)        # base shape
     sw.begin_stack()
     sw.create_sphere(radius=0.01)    # stacked on top
+    sw.commit()                      # rebuild + zoom once for the stack
     sw.reset()
+
+    # Same stack in one call - each op sits on top of the previous one
+    sw.create_batch([{'shape': 'cube', 'size': 0.02},
+                     {'shape': 'sphere', 'radius': 0.01}])
 """
 import win32com.client
 import pythoncom
 import os
+import glob
+import json
 import math
 import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+
+# =============================================================================
+# SolidWorks Constants
+# =============================================================================
+# Values from the SolidWorks Constants type library (swconst), named here so
+# the API calls below read without magic numbers.
+
+SW_END_COND_BLIND = 0            # swEndConditions_e.swEndCondBlind
+SW_REF_PLANE_DISTANCE = 4        # swRefPlaneReferenceConstraint_Distance
+SW_THIN_WALL_ONE_DIRECTION = 0   # swThinWallType_e.swThinWallOneDirection
+SW_DEFAULT_TEMPLATE_PART = 8     # swUserPreferenceStringValue_e.swDefaultTemplatePart
+SW_SLOT_STRAIGHT = 0             # swSketchSlotCreationType_e.swSketchSlotCreationType_line
+SW_SLOT_CENTER_CENTER = 0        # swSketchSlotLengthType_e.swSketchSlotLengthType_CenterCenter
+
+# FeatureExtrusion2 arguments after Dir1 depth, identical for every blind
+# extrusion: D2, draft flags/angles, offset flags, merge and feature scope.
+_EXTRUDE_TAIL = (
+    0.00254,
+    False, False, False, False,
+    1.74532925199433E-02, 1.74532925199433E-02,
+    False, False, False, False,
+    True, True, True, 0, 0, False,
+)
+
+
+# =============================================================================
+# Geometry Helpers
+# =============================================================================
+
+def _mm(*values):
+    """Format lengths in meters for messages: '12.5mm' or '10.0x20.0mm'."""
+    return 'x'.join([format(v * 1000, '.1f') for v in values]) + 'mm'
+
+
+@lru_cache(maxsize=256)
+def _star_vertices(num_points, outer_r, inner_r):
+    """Star vertices around the origin, first point straight down.
+
+    Pure function of its arguments, so repeated stars skip the work.
+    Each direction is the previous one rotated by a unit complex step,
+    so a star costs one cos/sin pair however many points it has.
+    Returns a tuple of (x, y) tuples, alternating outer and inner radius.
+    """
+    step = complex(math.cos(math.pi / num_points), math.sin(math.pi / num_points))
+    z = -1j
+    vertices = []
+    for r in (outer_r, inner_r) * num_points:
+        vertices.append((r * z.real, r * z.imag))
+        z *= step
+    return tuple(vertices)
+
+
+# =============================================================================
+# Template Lookup
+# =============================================================================
+
+PART_TEMPLATE = r"C:\ProgramData\SolidWorks\SOLIDWORKS {year}\templates\Part.prtdot"
+
+
+@lru_cache(maxsize=None)
+def _template_for_revision(major):
+    """Part template path for a SolidWorks major revision number.
+
+    SolidWorks major revisions map to release years (28 = 2020,
+    33 = 2025), so the install folder can be derived instead of probed.
+    Falls back to the newest installed year found by a single glob.
+    Cached per revision, so every SolidWorksCreator in the process shares
+    the lookup.
+    """
+    path = PART_TEMPLATE.format(year=major + 1992)
+    if os.path.exists(path):
+        return path
+    # Four-digit years sort lexically, so max() is the newest install
+    paths = glob.glob(PART_TEMPLATE.format(year='[0-9]' * 4))
+    return max(paths) if paths else None
+
+
+CACHE_PATH = os.path.join(
+    os.environ.get('LOCALAPPDATA', os.path.expanduser('~')),
+    'SolidWorksPromptApp', 'cache.json')
+
+
+def _load_cache():
+    """Read the on-disk cache, or {} if it is missing or unreadable."""
+    try:
+        with open(CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache):
+    """Write the on-disk cache; failures only cost the next start-up."""
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+
+# Loaded once per process; connect() only touches the disk on a miss
+_disk_cache = _load_cache()
+
+
+def cached_template(revision):
+    """Template path saved for this SolidWorks revision, if still present."""
+    path = _disk_cache.get('template_path')
+    if _disk_cache.get('revision') == revision and path and os.path.exists(path):
+        return path
+    return None
+
+
+def remember_template(revision, path):
+    """Save the template path for this revision for the next start-up."""
+    _disk_cache.update(revision=revision, template_path=path)
+    _save_cache(_disk_cache)
+
+
+def find_part_template(swApp, ask=None):
+    """Locate the SolidWorks part template for a connected swApp.
+
+    Reuses the path cached on disk by an earlier run of the same
+    SolidWorks revision, so an upgrade invalidates it. Otherwise uses
+    the default part template configured in SolidWorks when it exists,
+    else derives the install folder from RevisionNumber, else calls
+    ask() (e.g. a file dialog) if given.
+
+    Raises:
+        FileNotFoundError: If no template is found.
+    """
+    revision = swApp.RevisionNumber()
+    path = cached_template(revision)
+    if path:
+        return path
+
+    try:
+        path = swApp.GetUserPreferenceStringValue(SW_DEFAULT_TEMPLATE_PART)
+    except pythoncom.com_error:
+        path = None
+    if not (path and os.path.exists(path)):
+        path = _template_for_revision(int(revision.split('.')[0]))
+    if not path and ask is not None:
+        path = ask()
+    if not path:
+        raise FileNotFoundError("Could not find SolidWorks part template")
+    remember_template(revision, path)
+    return path
 
 
 # =============================================================================
@@ -44,6 +203,10 @@ class SolidWorksCreator:
     def __init__(self):
         self.swApp = None
         self.model = None
+        # Interfaces of self.model, fetched once per document by _new_part()
+        self.ext = None
+        self.skMgr = None
+        self.featMgr = None
         self.template_path = None
         self._nothing = None
         # Stacking state
@@ -51,28 +214,29 @@ class SolidWorksCreator:
         self._stack_height = 0.0
         self._last_shape_height = 0.0
         self._plane_height = None  # None = no active plane; float = Z height in meters
+        self._sketch_count = 0  # sketches opened in self.model so far
+        self._plane_cache = {}  # Z height -> reference plane name in self.model
+        self._view_pending = False  # rebuild/zoom deferred while stacking
+        self._command_depth = 0  # nesting depth of CommandInProgress windows
 
     def connect(self):
-        """Connect to the running SolidWorks instance."""
+        """Connect to the running SolidWorks instance.
+
+        The application object is early-bound through the makepy cache, so
+        method calls go straight to their DISPIDs instead of resolving each
+        name with GetIDsOfNames on every call.
+        """
         try:
-            self.swApp = win32com.client.GetActiveObject("SldWorks.Application")
+            app = win32com.client.GetActiveObject("SldWorks.Application")
         except Exception:
-            self.swApp = win32com.client.Dispatch("SldWorks.Application")
+            app = "SldWorks.Application"
+        self.swApp = win32com.client.gencache.EnsureDispatch(app)
 
         self.swApp.Visible = True
         self._nothing = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
-        self._find_template()
+        self.template_path = find_part_template(self.swApp)
         return True
 
-    def _find_template(self):
-        """Locate the SolidWorks part template."""
-        for year in ['2025', '2024', '2023', '2022', '2021', '2020']:
-            path = rf"C:\ProgramData\SolidWorks\SOLIDWORKS {year}\templates\Part.prtdot"
-            if os.path.exists(path):
-                self.template_path = path
-                return
-        raise FileNotFoundError("Could not find SolidWorks part template")
-
     # -------------------------------------------------------------------------
     # Stacking API
     # -------------------------------------------------------------------------
@@ -81,8 +245,14 @@ class SolidWorksCreator:
         """Enter stacking mode - next shapes reuse the current model."""
         self._stacking = True
 
+    def commit(self):
+        """Rebuild and zoom once for any shapes stacked since the last commit."""
+        if self._view_pending and self.model is not None:
+            self._refresh_view()
+
     def reset(self):
         """Exit stacking mode - next shape gets a new document."""
+        self.commit()
         self._stacking = False
         self._stack_height = 0.0
         self._last_shape_height = 0.0
@@ -103,19 +273,18 @@ class SolidWorksCreator:
         if height is None:
             height = self._stack_height
 
-        ext = self.model.Extension
-        ext.SelectByID2("Front Plane", "PLANE", 0, 0, 0, False, 0,
-                        self._nothing, 0)
-        refPlane = self.model.FeatureManager.InsertRefPlane(
-            4, height, 0, 0, 0, 0)
-        if refPlane is None:
-            raise RuntimeError(f"InsertRefPlane failed at height={height}")
-        self.model.ClearSelection2(True)
+        with self._batch():
+            self._ref_plane_at(height)
+            self.model.ClearSelection2(True)
 
         self._plane_height = height
         self._stacking = True
-        self._zoom_to_fit()
-        return f"Plane at {height*1000:.1f}mm"
+        # Always show the new plane, even mid-stack; inside create_batch()
+        # the batch's own commit() does it once CommandInProgress is off
+        self._view_pending = True
+        if not self._command_depth:
+            self.commit()
+        return f"Plane at {_mm(height)}"
 
     def set_height_to_plane(self):
         """Set working height to the active plane so the next shape starts there."""
@@ -124,15 +293,71 @@ class SolidWorksCreator:
         self._stack_height = self._plane_height
         self._stacking = True
 
+    # create_batch() start modes -> method run before the first op
+    _BATCH_STARTS = {
+        'new': 'reset',
+        'stack': 'begin_stack',
+        'plane': 'set_height_to_plane',
+    }
+
+    def create_batch(self, ops, start=None):
+        """Create several shapes in one CommandInProgress window.
+
+        Each op stacks on top of the one before it, and the model is rebuilt
+        and zoomed once at the end instead of after every shape. Through
+        SolidworksServer the whole list is also a single round trip.
+
+        Args:
+            ops: List of dicts. 'shape' names a create_* method (e.g.
+                'cube', 'polygon_3d'); the other keys are its arguments.
+                The first op follows the current stacking state.
+            start: How the first op is placed, applied in the same call so
+                a shared SolidworksServer creator runs the whole prompt
+                without another client in between. 'new' starts a new
+                part (reset()), 'stack' stacks on the current model
+                (begin_stack()), 'plane' starts on the active plane
+                (set_height_to_plane()); None keeps the current state.
+
+        Afterwards the stacking mode is what it was after `start` (a
+        'plane' op leaves it on, like create_plane() does), and the view
+        is refreshed even if an op raises.
+
+        Returns:
+            list[str]: The description returned for each shape.
+        """
+        if start is not None:
+            getattr(self, self._BATCH_STARTS[start])()
+        stacking = self._stacking
+        names = []
+        try:
+            with self._command_in_progress():
+                for op in ops:
+                    kwargs = dict(op)
+                    create = getattr(self, f"create_{kwargs.pop('shape')}")
+                    names.append(create(**kwargs))
+                    self._stacking = True
+        finally:
+            self._stacking = stacking or any(op.get('shape') == 'plane' for op in ops)
+            self.commit()
+        return names
+
     # -------------------------------------------------------------------------
     # Part & Sketch Management
     # -------------------------------------------------------------------------
 
     def _new_part(self):
         """Create a new part document."""
-        self.model = self.swApp.NewDocument(self.template_path, 0, 0, 0)
-        if not self.model:
+        model = self.swApp.NewDocument(self.template_path, 0, 0, 0)
+        if not model:
             raise RuntimeError("Failed to create new part document")
+        # NewDocument returns a plain IDispatch; cast it so the model gets
+        # the early-bound IModelDoc2 wrapper as well.
+        self.model = win32com.client.CastTo(model, "IModelDoc2")
+        self.ext = self.model.Extension
+        self.skMgr = self.model.SketchManager
+        self.featMgr = self.model.FeatureManager
+        self._sketch_count = 0
+        self._plane_cache = {}
         return self.model
 
     def _get_or_create_part(self):
@@ -143,50 +368,87 @@ class SolidWorksCreator:
         self._last_shape_height = 0.0
         return self._new_part()
 
-    def _next_sketch_name(self, model):
-        """Predict the name of the next sketch by counting existing ones.
+    def _open_sketch(self, skMgr):
+        """Open a sketch on the current selection and return its name.
 
         SolidWorks names sketches sequentially: Sketch1, Sketch2, etc.
-        Late-bound COM can't use GetActiveSketch2(), so we count
-        ProfileFeature entries in the feature tree instead.
+        Every sketch in self.model is opened through here, so counting
+        locally gives the name without walking the feature tree.
         """
-        count = 0
-        feat = model.FirstFeature
-        while feat:
-            if feat.GetTypeName2 == "ProfileFeature":
-                count += 1
-            feat = feat.GetNextFeature
-        return f"Sketch{count + 1}"
-
-    def _start_sketch_at_height(self, model, z_height):
-        """Open a sketch on a plane at the given Z offset from Front Plane.
+        skMgr.InsertSketch(True)
+        self._sketch_count += 1
+        return f"Sketch{self._sketch_count}"
+
+    def _ref_plane_at(self, z_height):
+        """Return the name of a reference plane at z_height above Front Plane.
 
-        If z_height is 0, uses Front Plane directly. Otherwise creates an
-        offset reference plane.
+        Planes are created once per height and remembered, so later shapes
+        at the same height (e.g. a stack built on a plane) reuse them.
         """
-        ext = model.Extension
-        skMgr = model.SketchManager
+        name = self._plane_cache.get(z_height)
+        if name is not None:
+            return name
+        self.ext.SelectByID2("Front Plane", "PLANE", 0, 0, 0, False, 0,
+                             self._nothing, 0)
+        refPlane = self.featMgr.InsertRefPlane(
+            SW_REF_PLANE_DISTANCE, z_height, 0, 0, 0, 0)
+        if refPlane is None:
+            raise RuntimeError(f"InsertRefPlane failed at z_height={z_height}")
+        name = self._plane_cache[z_height] = refPlane.Name
+        return name
+
+    def _start_sketch_at_height(self, z_height):
+        """Open a sketch on a plane at the given Z offset from Front Plane.
 
+        If z_height is 0, uses Front Plane directly. Otherwise sketches on
+        an offset reference plane (see _ref_plane_at).
+
+        Returns:
+            str: Name of the opened sketch (e.g. "Sketch2").
+        """
         if z_height == 0.0:
-            ext.SelectByID2("Front Plane", "PLANE", 0, 0, 0, False, 0,
-                            self._nothing, 0)
+            plane_name = "Front Plane"
         else:
-            # Select Front Plane as the base for the offset
-            ext.SelectByID2("Front Plane", "PLANE", 0, 0, 0, False, 0,
-                            self._nothing, 0)
-            # Create offset reference plane
-            # 4 = swRefPlaneReferenceConstraint_Distance
-            refPlane = model.FeatureManager.InsertRefPlane(4, z_height,
-                                                           0, 0, 0, 0)
-            if refPlane is None:
-                raise RuntimeError(
-                    f"InsertRefPlane failed at z_height={z_height}")
-            # Select the new plane for sketching
-            model.ClearSelection2(True)
-            ext.SelectByID2(refPlane.Name, "PLANE", 0, 0, 0, False, 0,
-                            self._nothing, 0)
-
-        skMgr.InsertSketch(True)
+            plane_name = self._ref_plane_at(z_height)
+        # Append=False replaces the current selection, so no ClearSelection2
+        self.ext.SelectByID2(plane_name, "PLANE", 0, 0, 0, False, 0,
+                             self._nothing, 0)
+        return self._open_sketch(self.skMgr)
+
+    @contextmanager
+    def _command_in_progress(self):
+        """Set ISldWorks.CommandInProgress for the duration of the block.
+
+        Out-of-process callers set it so SolidWorks does not refresh after
+        every individual API call. Windows nest: only the outermost one
+        touches the flag, so create_batch() can span several shapes.
+        """
+        outermost = self._command_depth == 0
+        if outermost:
+            self.swApp.CommandInProgress = True
+        self._command_depth += 1
+        try:
+            yield
+        finally:
+            self._command_depth -= 1
+            if outermost:
+                self.swApp.CommandInProgress = False
+
+    @contextmanager
+    def _batch(self):
+        """Suppress SolidWorks UI/model updates for a burst of COM calls.
+
+        Runs inside a CommandInProgress window and freezes the
+        FeatureManager tree of the model until the batch ends.
+        Rebuild and zoom should happen after the batch exits.
+        """
+        featMgr = self.featMgr
+        with self._command_in_progress():
+            featMgr.EnableFeatureTree = False
+            try:
+                yield
+            finally:
+                featMgr.EnableFeatureTree = True
 
     def _advance_stack(self, shape_height):
         """Update stacking state after creating a shape."""
@@ -194,74 +456,138 @@ class SolidWorksCreator:
         self._last_shape_height = shape_height
 
     def _zoom_to_fit(self):
-        """Rebuild and zoom to fit the current model."""
-        self.model.ViewZoomtofit2()
+        """Rebuild and zoom to fit, deferred while stacking or batching.
+
+        Mid-stack shapes only mark the view as stale; commit() or reset()
+        then rebuilds once for the whole stack. The flush is explicit rather
+        than timer-driven: the COM interfaces belong to the caller's thread.
+        """
+        if self._stacking or self._command_depth:
+            self._view_pending = True
+            return
+        self._refresh_view()
+
+    def _refresh_view(self):
+        """Rebuild the current model and zoom to fit it."""
         self.model.ForceRebuild3(True)
+        self.model.ViewZoomtofit2()
+        self._view_pending = False
 
     # -------------------------------------------------------------------------
     # Sketch Helpers
     # -------------------------------------------------------------------------
 
+    @contextmanager
+    def _fast_sketch(self, skMgr):
+        """Add sketch entities straight to the sketch database.
+
+        With AddToDB on and DisplayWhenAdded off, SolidWorks skips
+        inference, snapping and the redraw for each entity; everything is
+        solved once when the sketch is closed. Worth it for sketches with
+        several entities - toggling both flags costs four property sets,
+        so single-call sketches (one circle, ellipse, CreatePolygon,
+        CreateCornerRectangle or CreateSketchSlot) are left alone.
+        """
+        skMgr.AddToDB = True
+        skMgr.DisplayWhenAdded = False
+        try:
+            yield
+        finally:
+            skMgr.AddToDB = False
+            skMgr.DisplayWhenAdded = True
+
     def _draw_polygon(self, skMgr, cx, cy, radius, sides):
-        """Draw a regular polygon in the active sketch."""
-        points = []
-        for i in range(sides):
-            angle = 2 * math.pi * i / sides - math.pi / 2
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            points.append((x, y))
-        for i in range(sides):
-            x1, y1 = points[i]
-            x2, y2 = points[(i + 1) % sides]
-            skMgr.CreateLine(x1, y1, 0, x2, y2, 0)
+        """Draw a regular polygon in the active sketch.
+
+        radius is the circumradius (center to vertex). CreatePolygon builds
+        every edge in one COM call; Inscribed=False makes the construction
+        circle pass through the vertices, so the first vertex sits straight
+        below the center, matching the star orientation.
+        """
+        skMgr.CreatePolygon(cx, cy, 0, cx, cy - radius, 0, sides, False)
+
+    def _draw_polyline(self, skMgr, points):
+        """Draw a closed outline through (x, y) points in the active sketch.
+
+        One CreateLine per edge, with the bound method looked up once and
+        entities added straight to the sketch database.
+        """
+        create_line = skMgr.CreateLine
+        x1, y1 = points[-1]
+        with self._fast_sketch(skMgr):
+            for x2, y2 in points:
+                create_line(x1, y1, 0, x2, y2, 0)
+                x1, y1 = x2, y2
+
+    def _draw_rectangle(self, skMgr, hx, hy):
+        """Draw a rectangle centered on the origin in the active sketch.
+
+        CreateCornerRectangle builds all four edges in one COM call; the
+        corner-by-corner outline is only drawn if the API lacks it.
+        """
+        create_rectangle = getattr(skMgr, 'CreateCornerRectangle', None)
+        if create_rectangle is None:
+            self._draw_polyline(skMgr, [(-hx, -hy), (hx, -hy), (hx, hy), (-hx, hy)])
+            return
+        create_rectangle(-hx, -hy, 0, hx, hy, 0)
+
+    def _draw_slot(self, skMgr, half_len, r):
+        """Draw a straight slot along X centered on the origin.
+
+        half_len is the distance from the origin to each arc center and r
+        the end radius. CreateSketchSlot (SolidWorks 2014+) builds the
+        whole slot in one COM call; older versions get two lines and two
+        arcs.
+        """
+        create_slot = getattr(skMgr, 'CreateSketchSlot', None)
+        if create_slot is not None:
+            create_slot(SW_SLOT_STRAIGHT, SW_SLOT_CENTER_CENTER, 2 * r,
+                        -half_len, 0, 0, half_len, 0, 0, 0, 0, 0,
+                        1, False)
+            return
+        with self._fast_sketch(skMgr):
+            create_line = skMgr.CreateLine
+            create_arc = skMgr.CreateArc
+            create_line(-half_len,  r, 0,  half_len,  r, 0)
+            create_arc(half_len, 0, 0, half_len, r, 0, half_len, -r, 0, -1)
+            create_line( half_len, -r, 0, -half_len, -r, 0)
+            create_arc(-half_len, 0, 0, -half_len, -r, 0, -half_len, r, 0, -1)
 
     def _draw_star(self, skMgr, cx, cy, outer_r, inner_r, num_points):
         """Draw a star shape in the active sketch."""
-        vertices = []
-        for i in range(num_points * 2):
-            angle = math.pi * i / num_points - math.pi / 2
-            r = outer_r if i % 2 == 0 else inner_r
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            vertices.append((x, y))
-        for i in range(len(vertices)):
-            x1, y1 = vertices[i]
-            x2, y2 = vertices[(i + 1) % len(vertices)]
-            skMgr.CreateLine(x1, y1, 0, x2, y2, 0)
-
-    def _extrude(self, featMgr, height):
+        self._draw_polyline(skMgr, [
+            (cx + x, cy + y)
+            for x, y in _star_vertices(num_points, outer_r, inner_r)])
+
+    def _extrude(self, height):
         """Standard blind extrusion of the current sketch."""
-        featMgr.FeatureExtrusion2(
-            True, False, False, 0, 0, height, 0.00254,
-            False, False, False, False,
-            1.74532925199433E-02, 1.74532925199433E-02,
-            False, False, False, False,
-            True, True, True, 0, 0, False
-        )
+        self.featMgr.FeatureExtrusion2(
+            True, False, False, SW_END_COND_BLIND, SW_END_COND_BLIND,
+            height, *_EXTRUDE_TAIL)
 
-    def _revolve(self, featMgr):
+    def _revolve(self):
         """Solid revolve 360 degrees around the pre-selected axis (mark=4).
 
         IMPORTANT: FeatureRevolve2 parameter order is:
             Dir1Type, Dir2Type, Dir1Angle, Dir2Angle
         NOT Dir1Type, Dir1Angle, Dir2Type, Dir2Angle.
         """
-        feat = featMgr.FeatureRevolve2(
+        feat = self.featMgr.FeatureRevolve2(
             True,               # SingleDir
             True,               # IsSolid
             False,              # IsThin
             False,              # IsCut
             False,              # ReverseDir
             False,              # BothDirectionUpToSameEntity
-            0,                  # Dir1Type  (swEndCondBlind)
-            0,                  # Dir2Type  (swEndCondBlind)
+            SW_END_COND_BLIND,  # Dir1Type
+            SW_END_COND_BLIND,  # Dir2Type
             2 * math.pi,       # Dir1Angle (360 degrees)
             0.0,                # Dir2Angle
             False,              # OffsetReverse1
             False,              # OffsetReverse2
             0.0,                # OffsetDistance1
             0.0,                # OffsetDistance2
-            0,                  # ThinType
+            SW_THIN_WALL_ONE_DIRECTION,  # ThinType
             0.0,                # ThinThickness1
             0.0,                # ThinThickness2
             True,               # Merge
@@ -285,38 +611,40 @@ class SolidWorksCreator:
         Returns:
             str: Description of the created shape.
         """
-        model = self._get_or_create_part()
-        ext = model.Extension
-        skMgr = model.SketchManager
-        featMgr = model.FeatureManager
-
-        # Predict the sketch name before opening it (Sketch1, Sketch2, etc.)
-        sketch_name = self._next_sketch_name(model)
-
-        # Sphere center must be offset so the bottom sits at _stack_height
-        sphere_center_z = self._stack_height + radius
-        self._start_sketch_at_height(model, sphere_center_z)
-
-        # Semicircle arc: start (top), end (bottom), midpoint (right)
-        skMgr.Create3PointArc(0, radius, 0, 0, -radius, 0, radius, 0, 0)
-
-        # Centerline along Y axis as revolve axis
-        skMgr.CreateCenterLine(0, -radius, 0, 0, radius, 0)
-
-        # Close sketch
-        skMgr.InsertSketch(True)
-        time.sleep(0.3)
-
-        # Select the centerline as revolve axis (mark=4)
-        model.ClearSelection2(True)
-        ext.SelectByID2(f"Line1@{sketch_name}", "EXTSKETCHSEGMENT", 0, 0, 0,
-                         False, 4, self._nothing, 0)
-
-        # Revolve 360 degrees
-        self._revolve(featMgr)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+
+            # Sphere center must be offset so the bottom sits at _stack_height
+            sphere_center_z = self._stack_height + radius
+            sketch_name = self._start_sketch_at_height(sphere_center_z)
+
+            # Semicircle arc: start (top), end (bottom), midpoint (right)
+            skMgr.Create3PointArc(0, radius, 0, 0, -radius, 0, radius, 0, 0)
+
+            # Centerline along Y axis as revolve axis
+            skMgr.CreateCenterLine(0, -radius, 0, 0, radius, 0)
+
+            # Close sketch and rebuild so its segments can be selected
+            skMgr.InsertSketch(True)
+            self.model.EditRebuild3()
+
+            # Select the centerline as revolve axis (mark=4), retrying
+            # briefly in case SolidWorks has not published the sketch yet
+            axis = f"Line1@{sketch_name}"
+            for _ in range(3):
+                if self.ext.SelectByID2(axis, "EXTSKETCHSEGMENT", 0, 0, 0,
+                                        False, 4, self._nothing, 0):
+                    break
+                time.sleep(0.02)
+            else:
+                raise RuntimeError(f"Could not select revolve axis {axis}")
+
+            # Revolve 360 degrees
+            self._revolve()
         self._advance_stack(2 * radius)
         self._zoom_to_fit()
-        return f"Sphere (r={radius*1000:.1f}mm)"
+        return f"Sphere (r={_mm(radius)})"
 
     def create_cylinder(self, radius=0.01, height=0.02):
         """Create a cylinder (extruded circle).
@@ -325,15 +653,16 @@ class SolidWorksCreator:
             radius: Cylinder radius in meters.
             height: Cylinder height in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        skMgr.CreateCircle(0, 0, 0, radius, 0, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            skMgr.CreateCircle(0, 0, 0, radius, 0, 0)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"Cylinder (r={radius*1000:.1f}mm, h={height*1000:.1f}mm)"
+        return f"Cylinder (r={_mm(radius)}, h={_mm(height)})"
 
     def create_cube(self, size=0.02):
         """Create a cube (equal-sided box).
@@ -352,19 +681,16 @@ class SolidWorksCreator:
             depth:  Y dimension in meters.
             name:   Display name for the result string.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        hx, hy = width / 2, depth / 2
-        skMgr.CreateLine(-hx, -hy, 0,  hx, -hy, 0)
-        skMgr.CreateLine( hx, -hy, 0,  hx,  hy, 0)
-        skMgr.CreateLine( hx,  hy, 0, -hx,  hy, 0)
-        skMgr.CreateLine(-hx,  hy, 0, -hx, -hy, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            self._draw_rectangle(skMgr, width / 2, depth / 2)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"{name} ({width*1000:.1f}x{height*1000:.1f}x{depth*1000:.1f}mm)"
+        return f"{name} ({_mm(width, height, depth)})"
 
     def create_polygon_3d(self, radius=0.01, height=0.01, sides=6, name=None):
         """Create an extruded regular polygon.
@@ -379,15 +705,16 @@ class SolidWorksCreator:
             names = {3: "Triangle", 5: "Pentagon", 6: "Hexagon",
                      8: "Octagon"}
             name = names.get(sides, f"{sides}-gon")
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        self._draw_polygon(skMgr, 0, 0, radius, sides)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            self._draw_polygon(skMgr, 0, 0, radius, sides)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"{name} (r={radius*1000:.1f}mm, h={height*1000:.1f}mm)"
+        return f"{name} (r={_mm(radius)}, h={_mm(height)})"
 
     def create_triangle_3d(self, base=0.02, tri_height=0.02, depth=0.01):
         """Create a triangular prism.
@@ -397,18 +724,17 @@ class SolidWorksCreator:
             tri_height: Triangle height in meters.
             depth:      Extrusion depth in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        hb = base / 2
-        skMgr.CreateLine(-hb, 0, 0,  hb, 0, 0)
-        skMgr.CreateLine( hb, 0, 0,  0, tri_height, 0)
-        skMgr.CreateLine( 0, tri_height, 0, -hb, 0, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, depth)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            hb = base / 2
+            self._draw_polyline(skMgr, [(-hb, 0), (hb, 0), (0, tri_height)])
+            skMgr.InsertSketch(True)
+            self._extrude(depth)
         self._advance_stack(depth)
         self._zoom_to_fit()
-        return f"Triangle Prism (base={base*1000:.1f}mm)"
+        return f"Triangle Prism (base={_mm(base)})"
 
     def create_ellipse_3d(self, major=0.02, minor=0.01, height=0.01):
         """Create an extruded ellipse.
@@ -418,15 +744,16 @@ class SolidWorksCreator:
             minor:  Minor axis diameter in meters.
             height: Extrusion height in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        skMgr.CreateEllipse(0, 0, 0, major / 2, 0, 0, 0, minor / 2, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            skMgr.CreateEllipse(0, 0, 0, major / 2, 0, 0, 0, minor / 2, 0)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"Ellipse ({major*1000:.1f}x{minor*1000:.1f}mm, h={height*1000:.1f}mm)"
+        return f"Ellipse ({_mm(major, minor)}, h={_mm(height)})"
 
     def create_slot_3d(self, length=0.03, width=0.01, height=0.005):
         """Create an extruded slot (stadium / oblong).
@@ -436,39 +763,47 @@ class SolidWorksCreator:
             width:  Slot width in meters.
             height: Extrusion height in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        r = width / 2
-        half_len = (length - width) / 2
-        skMgr.CreateLine(-half_len,  r, 0,  half_len,  r, 0)
-        skMgr.CreateArc(half_len, 0, 0, half_len, r, 0, half_len, -r, 0, -1)
-        skMgr.CreateLine( half_len, -r, 0, -half_len, -r, 0)
-        skMgr.CreateArc(-half_len, 0, 0, -half_len, -r, 0, -half_len, r, 0, -1)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            self._draw_slot(skMgr, (length - width) / 2, width / 2)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"Slot ({length*1000:.1f}x{width*1000:.1f}mm)"
+        return f"Slot ({_mm(length, width)})"
 
     def create_washer(self, outer=0.02, inner=0.01, height=0.005):
         """Create a washer / ring (extruded annulus).
 
+        Both circles go in one sketch and a single extrusion cuts the hole
+        as part of the same feature - cheaper than extruding a disk and
+        adding a hole feature, which needs a face selection and a second
+        rebuild.
+
         Args:
             outer:  Outer diameter in meters.
             inner:  Inner diameter (hole) in meters.
             height: Extrusion height in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        skMgr.CreateCircle(0, 0, 0, outer / 2, 0, 0)
-        skMgr.CreateCircle(0, 0, 0, inner / 2, 0, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        if not 0 < inner < outer:
+            raise ValueError(
+                f"Washer inner diameter ({_mm(inner)}) must be "
+                f"smaller than the outer ({_mm(outer)})")
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            create_circle = skMgr.CreateCircle
+            with self._fast_sketch(skMgr):
+                create_circle(0, 0, 0, outer / 2, 0, 0)
+                create_circle(0, 0, 0, inner / 2, 0, 0)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"Washer (OD={outer*1000:.1f}mm, ID={inner*1000:.1f}mm)"
+        return f"Washer (OD={_mm(outer)}, ID={_mm(inner)})"
 
     def create_lshape(self, width=0.02, length=0.02, thickness=0.003,
                       depth=0.01):
@@ -480,20 +815,18 @@ class SolidWorksCreator:
             thickness: Wall thickness in meters.
             depth:     Extrusion depth in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        skMgr.CreateLine(0, 0, 0, width, 0, 0)
-        skMgr.CreateLine(width, 0, 0, width, thickness, 0)
-        skMgr.CreateLine(width, thickness, 0, thickness, thickness, 0)
-        skMgr.CreateLine(thickness, thickness, 0, thickness, length, 0)
-        skMgr.CreateLine(thickness, length, 0, 0, length, 0)
-        skMgr.CreateLine(0, length, 0, 0, 0, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, depth)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            self._draw_polyline(skMgr, [
+                (0, 0), (width, 0), (width, thickness),
+                (thickness, thickness), (thickness, length), (0, length)])
+            skMgr.InsertSketch(True)
+            self._extrude(depth)
         self._advance_stack(depth)
         self._zoom_to_fit()
-        return f"L-Shape ({width*1000:.1f}x{length*1000:.1f}mm)"
+        return f"L-Shape ({_mm(width, length)})"
 
     def create_cross(self, size=0.02, thickness=0.005, depth=0.005):
         """Create a cross / plus-shaped extrusion.
@@ -503,27 +836,20 @@ class SolidWorksCreator:
             thickness: Arm thickness in meters.
             depth:     Extrusion depth in meters.
         """
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        hs, ht = size / 2, thickness / 2
-        skMgr.CreateLine(-ht,  hs, 0,  ht,  hs, 0)
-        skMgr.CreateLine( ht,  hs, 0,  ht,  ht, 0)
-        skMgr.CreateLine( ht,  ht, 0,  hs,  ht, 0)
-        skMgr.CreateLine( hs,  ht, 0,  hs, -ht, 0)
-        skMgr.CreateLine( hs, -ht, 0,  ht, -ht, 0)
-        skMgr.CreateLine( ht, -ht, 0,  ht, -hs, 0)
-        skMgr.CreateLine( ht, -hs, 0, -ht, -hs, 0)
-        skMgr.CreateLine(-ht, -hs, 0, -ht, -ht, 0)
-        skMgr.CreateLine(-ht, -ht, 0, -hs, -ht, 0)
-        skMgr.CreateLine(-hs, -ht, 0, -hs,  ht, 0)
-        skMgr.CreateLine(-hs,  ht, 0, -ht,  ht, 0)
-        skMgr.CreateLine(-ht,  ht, 0, -ht,  hs, 0)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, depth)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            hs, ht = size / 2, thickness / 2
+            self._draw_polyline(skMgr, [
+                (-ht,  hs), ( ht,  hs), ( ht,  ht), ( hs,  ht),
+                ( hs, -ht), ( ht, -ht), ( ht, -hs), (-ht, -hs),
+                (-ht, -ht), (-hs, -ht), (-hs,  ht), (-ht,  ht)])
+            skMgr.InsertSketch(True)
+            self._extrude(depth)
         self._advance_stack(depth)
         self._zoom_to_fit()
-        return f"Cross ({size*1000:.1f}mm)"
+        return f"Cross ({_mm(size)})"
 
     def create_star_3d(self, outer=0.02, inner=None, points=5, height=0.005):
         """Create an extruded star.
@@ -536,15 +862,16 @@ class SolidWorksCreator:
         """
         if inner is None:
             inner = outer * 0.4
-        model = self._get_or_create_part()
-        skMgr = model.SketchManager
-        self._start_sketch_at_height(model, self._stack_height)
-        self._draw_star(skMgr, 0, 0, outer, inner, points)
-        skMgr.InsertSketch(True)
-        self._extrude(model.FeatureManager, height)
+        self._get_or_create_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._start_sketch_at_height(self._stack_height)
+            self._draw_star(skMgr, 0, 0, outer, inner, points)
+            skMgr.InsertSketch(True)
+            self._extrude(height)
         self._advance_stack(height)
         self._zoom_to_fit()
-        return f"{points}-Point Star (r={outer*1000:.1f}mm)"
+        return f"{points}-Point Star (r={_mm(outer)})"
 
     # =========================================================================
     # 2D Shapes (sketch only, no extrusion)
@@ -552,41 +879,36 @@ class SolidWorksCreator:
 
     def create_circle_2d(self, radius=0.01):
         """Create a 2D circle sketch."""
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        skMgr.CreateCircle(0, 0, 0, radius, 0, 0)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            skMgr.CreateCircle(0, 0, 0, radius, 0, 0)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"Circle 2D (r={radius*1000:.1f}mm)"
+        return f"Circle 2D (r={_mm(radius)})"
 
     def create_square_2d(self, size=0.02):
         """Create a 2D square sketch."""
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        hs = size / 2
-        skMgr.CreateLine(-hs, -hs, 0,  hs, -hs, 0)
-        skMgr.CreateLine( hs, -hs, 0,  hs,  hs, 0)
-        skMgr.CreateLine( hs,  hs, 0, -hs,  hs, 0)
-        skMgr.CreateLine(-hs,  hs, 0, -hs, -hs, 0)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            self._draw_rectangle(skMgr, size / 2, size / 2)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"Square 2D ({size*1000:.1f}mm)"
+        return f"Square 2D ({_mm(size)})"
 
     def create_rectangle_2d(self, width=0.02, length=0.01):
         """Create a 2D rectangle sketch."""
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        hw, hl = width / 2, length / 2
-        skMgr.CreateLine(-hw, -hl, 0,  hw, -hl, 0)
-        skMgr.CreateLine( hw, -hl, 0,  hw,  hl, 0)
-        skMgr.CreateLine( hw,  hl, 0, -hw,  hl, 0)
-        skMgr.CreateLine(-hw,  hl, 0, -hw, -hl, 0)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            self._draw_rectangle(skMgr, width / 2, length / 2)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"Rectangle 2D ({width*1000:.1f}x{length*1000:.1f}mm)"
+        return f"Rectangle 2D ({_mm(width, length)})"
 
     def create_polygon_2d(self, radius=0.01, sides=6, name=None):
         """Create a 2D regular polygon sketch."""
@@ -594,48 +916,50 @@ class SolidWorksCreator:
             names = {3: "Triangle", 5: "Pentagon", 6: "Hexagon",
                      8: "Octagon"}
             name = names.get(sides, f"{sides}-gon")
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        self._draw_polygon(skMgr, 0, 0, radius, sides)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            self._draw_polygon(skMgr, 0, 0, radius, sides)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"{name} 2D (r={radius*1000:.1f}mm)"
+        return f"{name} 2D (r={_mm(radius)})"
 
     def create_ellipse_2d(self, major=0.02, minor=0.01):
         """Create a 2D ellipse sketch."""
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        skMgr.CreateEllipse(0, 0, 0, major / 2, 0, 0, 0, minor / 2, 0)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            skMgr.CreateEllipse(0, 0, 0, major / 2, 0, 0, 0, minor / 2, 0)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"Ellipse 2D ({major*1000:.1f}x{minor*1000:.1f}mm)"
+        return f"Ellipse 2D ({_mm(major, minor)})"
 
     def create_star_2d(self, outer=0.02, inner=None, points=5):
         """Create a 2D star sketch."""
         if inner is None:
             inner = outer * 0.4
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        self._draw_star(skMgr, 0, 0, outer, inner, points)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            self._draw_star(skMgr, 0, 0, outer, inner, points)
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"{points}-Point Star 2D (r={outer*1000:.1f}mm)"
+        return f"{points}-Point Star 2D (r={_mm(outer)})"
 
     def create_triangle_2d(self, base=0.02, tri_height=0.02):
         """Create a 2D triangle sketch."""
-        model = self._new_part()
-        skMgr = model.SketchManager
-        skMgr.InsertSketch(True)
-        hb = base / 2
-        skMgr.CreateLine(-hb, 0, 0,  hb, 0, 0)
-        skMgr.CreateLine( hb, 0, 0,  0, tri_height, 0)
-        skMgr.CreateLine( 0, tri_height, 0, -hb, 0, 0)
-        skMgr.InsertSketch(True)
+        self._new_part()
+        with self._batch():
+            skMgr = self.skMgr
+            self._open_sketch(skMgr)
+            hb = base / 2
+            self._draw_polyline(skMgr, [(-hb, 0), (hb, 0), (0, tri_height)])
+            skMgr.InsertSketch(True)
         self._zoom_to_fit()
-        return f"Triangle 2D (base={base*1000:.1f}mm)"
+        return f"Triangle 2D (base={_mm(base)})"
 
 
 # =============================================================================
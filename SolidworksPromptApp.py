@@ -12,18 +12,26 @@ Requirements:
 
 Usage:
     python SolidworksPromptApp.py
+
+    Start `python SolidworksServer.py` first to keep one SolidWorks
+    connection warm across launches; otherwise the GUI connects itself.
 """
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import win32com.client
 import pythoncom
-import os
 import re
 import math
 import time
+import queue
+import threading
+import multiprocessing
+from functools import lru_cache
+from typing import NamedTuple
 
-from SolidworksCreate import SolidWorksCreator
+from SolidworksCreate import SolidWorksCreator, find_part_template
+from SolidworksServer import connect_creator
 
 
 # =============================================================================
@@ -39,85 +47,561 @@ UNIT_TO_METERS = {
 }
 
 def convert_to_meters(value, unit="mm"):
-    unit = unit.lower().strip().rstrip('.')
-    return value * UNIT_TO_METERS.get(unit, 0.001)
+    # Units captured by the parser regexes are already canonical keys, so
+    # only other spellings ("MM", "in.") pay for the cleanup
+    factor = UNIT_TO_METERS.get(unit)
+    if factor is None:
+        factor = UNIT_TO_METERS.get(unit.lower().strip().rstrip('.'), 0.001)
+    return value * factor
 
 
 # =============================================================================
 # Prompt Parser
 # =============================================================================
 
-class ParsedShape:
-    def __init__(self, shape_type, params, units="mm", is_2d=False, on_top_of=None):
-        self.shape_type = shape_type
-        self.params = params
-        self.units = units
-        self.is_2d = is_2d
-        self.on_top_of = on_top_of  # None, True (follow-up), or ParsedShape
+class ParsedShape(NamedTuple):
+    shape_type: str
+    params: dict
+    units: str = "mm"
+    is_2d: bool = False
+    on_top_of: object = None  # None, True (follow-up), 'plane', or ParsedShape
+
+
+# Unit words that set a prompt's default unit, ranked: inches beat
+# centimeters beat feet. Letters may not touch them, so "left" is not feet
+# but "10cm" is centimeters.
+_UNIT_RANK = {
+    'inch': (0, "in"), 'inches': (0, "in"), '"': (0, "in"), 'in': (0, "in"),
+    'cm': (1, "cm"), 'centimeter': (1, "cm"), 'centimeters': (1, "cm"),
+    'ft': (2, "ft"), 'feet': (2, "ft"),
+}
+_UNIT_WORD_RE = re.compile(
+    r'"|(?<![a-z])(inches|inch|in|centimeters|centimeter|cm|feet|ft)(?![a-z])')
+
+
+def detect_units(prompt_lower):
+    """Default unit of an already-lowercased prompt, "mm" if none is named."""
+    ranked = [_UNIT_RANK[m.group()] for m in _UNIT_WORD_RE.finditer(prompt_lower)]
+    return min(ranked)[1] if ranked else "mm"
+
+
+# Compiled once at import instead of on every parse. Every pattern in this
+# module runs on the lowercased prompt and spells its words in lowercase, so
+# none of them needs re.IGNORECASE and its case-folding match path.
+_UNIT_PATTERN = r'(mm|cm|m|in|inch|inches|ft|feet|foot|")?'
+_NUM_UNIT_RE = re.compile(rf'(\d+\.?\d*)\s*{_UNIT_PATTERN}')
+_AXBXC_RE = re.compile(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*x\s*(\d+\.?\d*)')
+_AXB_RE = re.compile(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)')
+_POINTS_RE = re.compile(r'(\d+)\s*point')
+_ON_PLANE_RE = re.compile(
+    r'(?:put\s+|place\s+|add\s+)?(?:a\s+|the\s+)?(.+?)\s+on\s+(?:the|that)\s+plane')
+_PLANE_RE = re.compile(
+    r'(?:create|add|make|place|insert)?\s*(?:a\s+|the\s+)?(?:horizontal\s+)?plane'
+    rf'(?:\s+at\s+(\d+\.?\d*)\s*{_UNIT_PATTERN})?')
+_ON_TOP_RE = re.compile(
+    r'(?:put\s+|place\s+|add\s+|stack\s+)?(?:a\s+|the\s+)?'
+    r'(.+?)\s+(?:on\s*top\s*of|above|on)\s+(?:a\s+|the\s+)?(.+)')
+_ON_TOP_SIMPLE_RE = re.compile(
+    r'(?:put|place|add|stack)\s+(?:a\s+|the\s+)?(.+?)\s+(?:on\s*top|above|on\s*it)\s*$')
+# Both stacking patterns need whitespace before "on"/"above"; this linear
+# scan rules them out before their lazy (.+?) groups backtrack
+_STACK_WORD_RE = re.compile(r'\s(?:on|above)')
+
+
+# Every keyword a shape branch asks parse_all_dimensions() about
+DIMENSION_KEYWORDS = (
+    'radius', 'r', 'diameter', 'dia', 'd', 'height', 'tall', 'h', 'long',
+    'length', 'l', 'width', 'wide', 'w', 'depth', 'deep', 'side', 'size', 's',
+    'thick', 't', 'extrude', 'base', 'b', 'major', 'minor', 'a', 'short',
+    'outer', 'outside', 'od', 'inner', 'inside', 'id', 'hole', 'arm',
+)
+
+
+def _keyword_alternation(keywords):
+    """Regex alternation of keywords, longest first, grouped by first letter.
+
+    re tries branches one by one, so 'r(?:adius|)|d(?:iameter|ia|...)' fails
+    on one character test where a flat 'radius|r|diameter|...' takes dozens.
+    """
+    groups = {}
+    for kw in sorted(keywords, key=len, reverse=True):
+        groups.setdefault(kw[0], []).append(re.escape(kw[1:]))
+    return '|'.join(f"{first}(?:{'|'.join(rests)})" for first, rests in groups.items())
+
+
+_KEYWORD_ALT = _keyword_alternation(DIMENSION_KEYWORDS)
+
+# Both dimension forms as zero-width lookaheads, so one finditer visits every
+# position and sees overlapping matches ('r 10' inside 'diameter 10') just
+# like searching for each keyword on its own. One form starts on a letter,
+# the other on a digit, so at most one applies at any position:
+#   kw/val/unit     "radius 10mm", "radius = 10", "radius of 10"
+#   val2/unit2/kw2  "10mm radius" - a unit must end its word, so "5 inside"
+#                   is 5 + 'inside' rather than 5in + 'side'
+_ALL_DIMS_RE = re.compile(
+    rf'(?=(?P<kw>{_KEYWORD_ALT})\s*(?:of|=|:)?\s*(?P<val>\d+\.?\d*)\s*'
+    rf'(?P<unit>mm|cm|m|in|inch|inches|ft|feet|foot|")?)'
+    rf'|(?=(?P<val2>\d+\.?\d*)\s*(?:(?P<unit2>mm|cm|m|in|inch|inches|ft|feet|foot|")(?![a-z]))?'
+    rf'\s*(?P<kw2>{_KEYWORD_ALT}))'
+)
+
+# "10 length" also answers 'l'; the alternation only reports the longest
+_KEYWORD_PREFIXES = {
+    kw: tuple(k for k in DIMENSION_KEYWORDS if kw.startswith(k))
+    for kw in DIMENSION_KEYWORDS
+}
 
 
-def detect_units(prompt):
-    prompt_lower = prompt.lower()
-    if any(u in prompt_lower for u in ['inch', 'inches', '"', ' in ']):
-        return "in"
-    elif 'cm' in prompt_lower or 'centimeter' in prompt_lower:
-        return "cm"
-    elif 'ft' in prompt_lower or 'feet' in prompt_lower:
-        return "ft"
-    return "mm"
+def parse_all_dimensions(prompt_lower, default_unit):
+    """Find every keyword dimension in one pass over the prompt.
+
+    Args:
+        prompt_lower:  The prompt, already lowercased.
+        default_unit:  Unit for values without one, from detect_units().
+
+    Returns:
+        dict: keyword -> value in meters, taken from the first match of the
+        keyword. "keyword 10mm" beats "10mm keyword" for the same keyword.
+    """
+    keyword_first, number_first = {}, {}
+    for match in _ALL_DIMS_RE.finditer(prompt_lower):
+        kw, value, unit, value2, unit2, kw2 = match.groups()
+        if kw is not None:
+            if kw not in keyword_first:
+                keyword_first[kw] = convert_to_meters(float(value), unit or default_unit)
+        else:
+            meters = convert_to_meters(float(value2), unit2 or default_unit)
+            for prefix in _KEYWORD_PREFIXES[kw2]:
+                number_first.setdefault(prefix, meters)
+    number_first.update(keyword_first)
+    return number_first
+
+
+def first_dimension(dims, *keywords):
+    """Value of the first keyword present in parse_all_dimensions() output."""
+    for keyword in keywords:
+        if keyword in dims:
+            return dims[keyword]
+    return None
 
 
 def extract_dimension(prompt, *keywords):
+    """First of keywords given a value in prompt, in meters, or None.
+
+    Kept for callers outside the parser. Both "radius 10" and "10 radius"
+    come from the one _ALL_DIMS_RE pass, not a pattern per keyword.
+    """
     prompt_lower = prompt.lower()
-    unit_pattern = r'(mm|cm|m|in|inch|inches|ft|feet|foot|")?'
+    dims = parse_all_dimensions(prompt_lower, detect_units(prompt_lower))
+    return first_dimension(dims, *keywords)
+
+
+def extract_all_numbers(prompt_lower, default_unit):
+    # convert_to_meters() inlined: _NUM_UNIT_RE only captures canonical
+    # lowercase units, so the scale comes straight from UNIT_TO_METERS
+    scale = UNIT_TO_METERS
+    default_scale = scale.get(default_unit, 0.001)
+    return [float(value) * (scale[unit] if unit else default_scale)
+            for value, unit in _NUM_UNIT_RE.findall(prompt_lower)]
+
+
+# =============================================================================
+# Shape Parsers
+# =============================================================================
+# One function per shape, picked by find_shape(). Each reads its dimensions
+# from the parse_all_dimensions() dict and falls back to bare numbers.
+
+# --- CYLINDER (3D) ---
+def _parse_cylinder(prompt_lower, dims, units, is_2d):
+    radius = first_dimension(dims, 'radius', 'r')
+    diameter = first_dimension(dims, 'diameter', 'dia', 'd')
+    height = first_dimension(dims, 'height', 'tall', 'long', 'h')
     
-    for keyword in keywords:
-        patterns = [
-            rf'{keyword}\s*(?:of|=|:)?\s*(\d+\.?\d*)\s*{unit_pattern}',
-            rf'(\d+\.?\d*)\s*{unit_pattern}\s*{keyword}',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, prompt_lower, re.IGNORECASE)
-            if match:
-                value = float(match.group(1))
-                unit = match.group(2) if match.group(2) else detect_units(prompt)
-                return convert_to_meters(value, unit)
-    return None
+    if diameter and not radius:
+        radius = diameter / 2
+    
+    if not radius or not height:
+        numbers = extract_all_numbers(prompt_lower, units)
+        if len(numbers) >= 2:
+            radius = radius or numbers[0]
+            height = height or numbers[1]
+    
+    radius = radius or 0.01
+    height = height or 0.02
+    return ParsedShape('cylinder', {'radius': radius, 'height': height}, units)
+
+
+# --- SPHERE (3D) ---
+def _parse_sphere(prompt_lower, dims, units, is_2d):
+    radius = first_dimension(dims, 'radius', 'r')
+    diameter = first_dimension(dims, 'diameter', 'dia', 'd')
+
+    if diameter and not radius:
+        radius = diameter / 2
+
+    if not radius:
+        numbers = extract_all_numbers(prompt_lower, units)
+        radius = numbers[0] if numbers else 0.01
+
+    radius = radius or 0.01
+    return ParsedShape('sphere', {'radius': radius}, units)
+
+
+# --- CUBE (3D) ---
+def _parse_cube(prompt_lower, dims, units, is_2d):
+    size = first_dimension(dims, 'side', 'size', 'length')
+    if not size:
+        numbers = extract_all_numbers(prompt_lower, units)
+        size = numbers[0] if numbers else 0.02
+    return ParsedShape('cube', {'size': size}, units)
+
+
+# --- BOX / RECTANGULAR PRISM (3D) ---
+def _parse_box(prompt_lower, dims, units, is_2d):
+    width = first_dimension(dims, 'width', 'wide', 'w')
+    height = first_dimension(dims, 'height', 'tall', 'h')
+    depth = first_dimension(dims, 'depth', 'deep', 'long', 'length', 'd', 'l')
+    
+    numbers = extract_all_numbers(prompt_lower, units)
+    axb_match = _AXBXC_RE.search(prompt_lower)
+    
+    if axb_match:
+        width = convert_to_meters(float(axb_match.group(1)), units)
+        height = convert_to_meters(float(axb_match.group(2)), units)
+        depth = convert_to_meters(float(axb_match.group(3)), units)
+    elif len(numbers) >= 3:
+        width = width or numbers[0]
+        height = height or numbers[1]
+        depth = depth or numbers[2]
+    elif len(numbers) == 1:
+        width = height = depth = numbers[0]
+    
+    width = width or 0.02
+    height = height or 0.02
+    depth = depth or 0.02
+    return ParsedShape('box', {'width': width, 'height': height, 'depth': depth}, units)
+
+
+# --- TRIANGLE ---
+def _parse_triangle(prompt_lower, dims, units, is_2d):
+    base = first_dimension(dims, 'base', 'width', 'b', 'w')
+    tri_height = first_dimension(dims, 'height', 'tall', 'h')
+    depth = first_dimension(dims, 'depth', 'thick', 'extrude', 'd')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not base and numbers:
+        base = numbers[0]
+    if not tri_height and len(numbers) >= 2:
+        tri_height = numbers[1]
+    if not depth and len(numbers) >= 3:
+        depth = numbers[2]
+    
+    base = base or 0.02
+    tri_height = tri_height or 0.02
+    depth = depth or 0.01
+    return ParsedShape('triangle', {'base': base, 'tri_height': tri_height, 'depth': depth}, units, is_2d)
+
+
+# --- HEXAGON / PENTAGON / OCTAGON ---
+def _parse_regular_polygon(shape, prompt_lower, dims, units, is_2d):
+    radius = first_dimension(dims, 'radius', 'r', 'size')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not radius and numbers:
+        radius = numbers[0]
+    if not height and len(numbers) >= 2:
+        height = numbers[1]
+    
+    radius = radius or 0.01
+    height = height or 0.01
+    return ParsedShape(shape, {'radius': radius, 'height': height}, units, is_2d)
+
+
+def _parse_hexagon(prompt_lower, dims, units, is_2d):
+    return _parse_regular_polygon('hexagon', prompt_lower, dims, units, is_2d)
+
+
+def _parse_pentagon(prompt_lower, dims, units, is_2d):
+    return _parse_regular_polygon('pentagon', prompt_lower, dims, units, is_2d)
+
+
+def _parse_octagon(prompt_lower, dims, units, is_2d):
+    return _parse_regular_polygon('octagon', prompt_lower, dims, units, is_2d)
+
+
+# --- ELLIPSE / OVAL ---
+def _parse_ellipse(prompt_lower, dims, units, is_2d):
+    major = first_dimension(dims, 'major', 'length', 'long', 'a')
+    minor = first_dimension(dims, 'minor', 'width', 'short', 'b')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not major and numbers:
+        major = numbers[0]
+    if not minor and len(numbers) >= 2:
+        minor = numbers[1]
+    if not height and len(numbers) >= 3:
+        height = numbers[2]
+    
+    major = major or 0.02
+    minor = minor or 0.01
+    height = height or 0.01
+    return ParsedShape('ellipse', {'major': major, 'minor': minor, 'height': height}, units, is_2d)
+
+
+# --- CIRCLE (2D default, or 3D if extruded) ---
+def _parse_circle(prompt_lower, dims, units, is_2d):
+    radius = first_dimension(dims, 'radius', 'r')
+    diameter = first_dimension(dims, 'diameter', 'dia', 'd')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick', 'extrude')
+    
+    if diameter and not radius:
+        radius = diameter / 2
+    if not radius:
+        numbers = extract_all_numbers(prompt_lower, units)
+        radius = numbers[0] if numbers else 0.01
+    
+    radius = radius or 0.01
+    if height:
+        return ParsedShape('cylinder', {'radius': radius, 'height': height}, units)
+    return ParsedShape('circle', {'radius': radius}, units, is_2d=True)
+
+
+# --- SQUARE (2D) ---
+def _parse_square(prompt_lower, dims, units, is_2d):
+    size = first_dimension(dims, 'side', 'size', 'length', 's')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick', 'extrude')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not size and numbers:
+        size = numbers[0]
+    
+    size = size or 0.02
+    if height:
+        return ParsedShape('cube', {'size': size}, units)
+    return ParsedShape('square', {'size': size}, units, is_2d=True)
 
 
-def extract_all_numbers(prompt):
-    results = []
-    default_unit = detect_units(prompt)
-    pattern = r'(\d+\.?\d*)\s*(mm|cm|m|in|inch|inches|ft|feet|foot|")?'
-    matches = re.findall(pattern, prompt.lower())
-    for value_str, unit in matches:
-        value = float(value_str)
-        unit = unit if unit else default_unit
-        results.append(convert_to_meters(value, unit))
-    return results
+# --- RECTANGLE (2D) ---
+def _parse_rectangle(prompt_lower, dims, units, is_2d):
+    width = first_dimension(dims, 'width', 'wide', 'w')
+    length = first_dimension(dims, 'length', 'long', 'l', 'height', 'h')
+    depth = first_dimension(dims, 'depth', 'thick', 'extrude', 'd')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    axb_match = _AXB_RE.search(prompt_lower)
+    if axb_match:
+        width = convert_to_meters(float(axb_match.group(1)), units)
+        length = convert_to_meters(float(axb_match.group(2)), units)
+    elif len(numbers) >= 2:
+        width = width or numbers[0]
+        length = length or numbers[1]
+    
+    width = width or 0.02
+    length = length or 0.01
+    if depth:
+        return ParsedShape('box', {'width': width, 'height': depth, 'depth': length}, units)
+    return ParsedShape('rectangle', {'width': width, 'length': length}, units, is_2d=True)
+
+
+# --- SLOT ---
+def _parse_slot(prompt_lower, dims, units, is_2d):
+    length = first_dimension(dims, 'length', 'long', 'l')
+    width = first_dimension(dims, 'width', 'wide', 'w')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not length and numbers:
+        length = numbers[0]
+    if not width and len(numbers) >= 2:
+        width = numbers[1]
+    if not height and len(numbers) >= 3:
+        height = numbers[2]
+    
+    length = length or 0.03
+    width = width or 0.01
+    height = height or 0.005
+    return ParsedShape('slot', {'length': length, 'width': width, 'height': height}, units, is_2d)
+
+
+# --- WASHER / RING ---
+def _parse_washer(prompt_lower, dims, units, is_2d):
+    outer = first_dimension(dims, 'outer', 'outside', 'od', 'diameter')
+    inner = first_dimension(dims, 'inner', 'inside', 'id', 'hole')
+    height = first_dimension(dims, 'height', 'tall', 'h', 'thick')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if not outer and numbers:
+        outer = numbers[0]
+    if not inner and len(numbers) >= 2:
+        inner = numbers[1]
+    if not height and len(numbers) >= 3:
+        height = numbers[2]
+    
+    outer = outer or 0.02
+    inner = inner or 0.01
+    height = height or 0.005
+    return ParsedShape('washer', {'outer': outer, 'inner': inner, 'height': height}, units, is_2d)
+
+
+# --- L-SHAPE ---
+def _parse_lshape(prompt_lower, dims, units, is_2d):
+    width = first_dimension(dims, 'width', 'w')
+    length = first_dimension(dims, 'length', 'l', 'height', 'h')
+    thickness = first_dimension(dims, 'thick', 't')
+    depth = first_dimension(dims, 'depth', 'd', 'extrude')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if len(numbers) >= 1:
+        width = width or numbers[0]
+    if len(numbers) >= 2:
+        length = length or numbers[1]
+    if len(numbers) >= 3:
+        thickness = thickness or numbers[2]
+    if len(numbers) >= 4:
+        depth = depth or numbers[3]
+    
+    width = width or 0.02
+    length = length or 0.02
+    thickness = thickness or 0.003
+    depth = depth or 0.01
+    return ParsedShape('lshape', {'width': width, 'length': length, 'thickness': thickness, 'depth': depth}, units, is_2d)
+
+
+# --- CROSS / PLUS ---
+def _parse_cross(prompt_lower, dims, units, is_2d):
+    size = first_dimension(dims, 'size', 's', 'width', 'w')
+    thickness = first_dimension(dims, 'thick', 't', 'arm')
+    depth = first_dimension(dims, 'depth', 'd', 'height', 'h')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    if len(numbers) >= 1:
+        size = size or numbers[0]
+    if len(numbers) >= 2:
+        thickness = thickness or numbers[1]
+    if len(numbers) >= 3:
+        depth = depth or numbers[2]
+    
+    size = size or 0.02
+    thickness = thickness or 0.005
+    depth = depth or 0.005
+    return ParsedShape('cross', {'size': size, 'thickness': thickness, 'depth': depth}, units, is_2d)
+
+
+# --- STAR ---
+def _parse_star(prompt_lower, dims, units, is_2d):
+    outer = first_dimension(dims, 'outer', 'radius', 'r', 'size')
+    inner = first_dimension(dims, 'inner')
+    points = 5
+    height = first_dimension(dims, 'height', 'h', 'thick', 'depth')
+    numbers = extract_all_numbers(prompt_lower, units)
+    
+    points_match = _POINTS_RE.search(prompt_lower)
+    if points_match:
+        points = int(points_match.group(1))
+    
+    if not outer and numbers:
+        outer = numbers[0]
+    if not height and len(numbers) >= 2:
+        height = numbers[1]
+    
+    outer = outer or 0.02
+    inner = inner or outer * 0.4
+    height = height or 0.005
+    return ParsedShape('star', {'outer': outer, 'inner': inner, 'points': points, 'height': height}, units, is_2d)
+
+
+# Shape keywords in priority order: when a prompt names several shapes the
+# earlier entry wins ("triangle prism" is a box)
+SHAPE_KEYWORDS = (
+    ('cylinder', ('cylinder', 'cylindrical', 'tube', 'pipe')),
+    ('sphere', ('sphere', 'ball', 'orb')),
+    ('cube', ('cube',)),
+    ('box', ('box', 'rectangular', 'prism', 'block')),
+    ('hexagon', ('hexagon', 'hex')),
+    ('triangle', ('triangle',)),
+    ('pentagon', ('pentagon',)),
+    ('octagon', ('octagon',)),
+    ('ellipse', ('ellipse', 'oval')),
+    ('circle', ('circle',)),
+    ('square', ('square',)),
+    ('rectangle', ('rectangle', 'rect')),
+    ('slot', ('slot',)),
+    ('washer', ('washer', 'ring', 'donut', 'annulus')),
+    ('lshape', ('l-shape', 'lshape', 'l shape')),
+    ('cross', ('cross', 'plus')),
+    ('star', ('star',)),
+)
+
+_SHAPE_PARSERS = {
+    'cylinder': _parse_cylinder,
+    'sphere': _parse_sphere,
+    'cube': _parse_cube,
+    'box': _parse_box,
+    'hexagon': _parse_hexagon,
+    'triangle': _parse_triangle,
+    'pentagon': _parse_pentagon,
+    'octagon': _parse_octagon,
+    'ellipse': _parse_ellipse,
+    'circle': _parse_circle,
+    'square': _parse_square,
+    'rectangle': _parse_rectangle,
+    'slot': _parse_slot,
+    'washer': _parse_washer,
+    'lshape': _parse_lshape,
+    'cross': _parse_cross,
+    'star': _parse_star,
+}
+
+# (keyword, shape) flattened in priority order
+_SHAPE_KEYWORD_ORDER = tuple(
+    (kw, shape) for shape, keywords in SHAPE_KEYWORDS for kw in keywords
+)
+
+
+def find_shape(prompt_lower):
+    """Name of the highest-priority shape mentioned in the prompt, or None.
+
+    Substring tests in priority order: str's C search over a prompt this
+    short beats a regex automaton over every keyword, and the scan stops
+    at the first shape that is named.
+    """
+    for keyword, shape in _SHAPE_KEYWORD_ORDER:
+        if keyword in prompt_lower:
+            return shape
+    return None
 
 
 def parse_prompt(prompt):
-    prompt_lower = prompt.lower().strip()
-    units = detect_units(prompt)
+    # Lowercased once here; everything below works on prompt_lower
+    return _parse_lowered(prompt.lower().strip())
+
+
+@lru_cache(maxsize=256)
+def _parse_lowered(prompt_lower):
+    """parse_prompt() for an already lowercased, stripped prompt.
+
+    Plane and stacking sub-prompts are slices of prompt_lower, so they
+    recurse here rather than through parse_prompt(). Results are cached
+    and shared between calls, so treat ParsedShape.params as read-only.
+    """
+    units = detect_units(prompt_lower)
+
+    # Sentence forms that cannot apply are skipped on a substring test
+    # instead of a full regex search
+    mentions_plane = 'plane' in prompt_lower
+    mentions_stack = _STACK_WORD_RE.search(prompt_lower) is not None
 
     # --- ON THE PLANE: "put a sphere on the plane", "cylinder on that plane" ---
-    on_plane_match = re.search(
-        r'(?:put\s+|place\s+|add\s+)?(?:a\s+|the\s+)?(.+?)\s+on\s+(?:the|that)\s+plane',
-        prompt_lower
-    )
+    on_plane_match = mentions_plane and mentions_stack and _ON_PLANE_RE.search(prompt_lower)
     if on_plane_match:
-        shape = parse_prompt(on_plane_match.group(1).strip())
+        shape = _parse_lowered(on_plane_match.group(1).strip())
         if shape:
-            shape.on_top_of = 'plane'
-            return shape
+            return shape._replace(on_top_of='plane')
 
     # --- PLANE CREATION: "create a plane", "add a plane at 15mm" ---
-    plane_match = re.search(
-        r'(?:create|add|make|place|insert)?\s*(?:a\s+|the\s+)?(?:horizontal\s+)?plane'
-        r'(?:\s+at\s+(\d+\.?\d*)\s*(mm|cm|m|in|inch|inches|ft|feet|foot|")?)?',
-        prompt_lower
-    )
+    plane_match = mentions_plane and _PLANE_RE.search(prompt_lower)
     if plane_match:
         height = None
         if plane_match.group(1):
@@ -126,349 +610,50 @@ def parse_prompt(prompt):
         return ParsedShape('plane', {'height': height}, units)
 
     # --- STACKING: "sphere on top of a cube", "put cylinder above box" ---
-    on_top_match = re.search(
-        r'(?:put\s+|place\s+|add\s+|stack\s+)?(?:a\s+|the\s+)?'
-        r'(.+?)\s+(?:on\s*top\s*of|above|on)\s+(?:a\s+|the\s+)?(.+)',
-        prompt_lower
-    )
+    on_top_match = mentions_stack and _ON_TOP_RE.search(prompt_lower)
     if on_top_match:
         top_prompt = on_top_match.group(1).strip()
         bottom_prompt = on_top_match.group(2).strip()
-        top_shape = parse_prompt(top_prompt)
-        bottom_shape = parse_prompt(bottom_prompt)
+        top_shape = _parse_lowered(top_prompt)
+        bottom_shape = _parse_lowered(bottom_prompt)
         if top_shape and bottom_shape:
-            top_shape.on_top_of = bottom_shape
-            return top_shape
+            return top_shape._replace(on_top_of=bottom_shape)
 
     # --- STACKING FOLLOW-UP: "put a sphere on top" ---
-    on_top_simple = re.search(
-        r'(?:put|place|add|stack)\s+(?:a\s+|the\s+)?(.+?)\s+(?:on\s*top|above|on\s*it)\s*$',
-        prompt_lower
-    )
+    on_top_simple = mentions_stack and _ON_TOP_SIMPLE_RE.search(prompt_lower)
     if on_top_simple:
-        shape = parse_prompt(on_top_simple.group(1).strip())
+        shape = _parse_lowered(on_top_simple.group(1).strip())
         if shape:
-            shape.on_top_of = True
-            return shape
+            return shape._replace(on_top_of=True)
+
+    # --- SINGLE SHAPE: "cylinder radius 5 height 20" ---
+    shape = find_shape(prompt_lower)
+    if shape is None:
+        return None
 
     # Check if 2D is requested
     is_2d = any(word in prompt_lower for word in ['2d', 'sketch', 'draw', 'flat'])
-
-    # --- CYLINDER (3D) ---
-    if any(word in prompt_lower for word in ['cylinder', 'cylindrical', 'tube', 'pipe']):
-        radius = extract_dimension(prompt, 'radius', 'r')
-        diameter = extract_dimension(prompt, 'diameter', 'dia', 'd')
-        height = extract_dimension(prompt, 'height', 'tall', 'long', 'h')
-        
-        if diameter and not radius:
-            radius = diameter / 2
-        
-        if not radius or not height:
-            numbers = extract_all_numbers(prompt)
-            if len(numbers) >= 2:
-                radius = radius or numbers[0]
-                height = height or numbers[1]
-        
-        radius = radius or 0.01
-        height = height or 0.02
-        return ParsedShape('cylinder', {'radius': radius, 'height': height}, units)
-    
-    # --- SPHERE (3D) ---
-    elif any(word in prompt_lower for word in ['sphere', 'ball', 'orb']):
-        radius = extract_dimension(prompt, 'radius', 'r')
-        diameter = extract_dimension(prompt, 'diameter', 'dia', 'd')
-
-        if diameter and not radius:
-            radius = diameter / 2
-
-        if not radius:
-            numbers = extract_all_numbers(prompt)
-            radius = numbers[0] if numbers else 0.01
-
-        radius = radius or 0.01
-        return ParsedShape('sphere', {'radius': radius}, units)
-
-    # --- CUBE (3D) ---
-    elif 'cube' in prompt_lower:
-        size = extract_dimension(prompt, 'side', 'size', 'length')
-        if not size:
-            numbers = extract_all_numbers(prompt)
-            size = numbers[0] if numbers else 0.02
-        return ParsedShape('cube', {'size': size}, units)
-    
-    # --- BOX / RECTANGULAR PRISM (3D) ---
-    elif any(word in prompt_lower for word in ['box', 'rectangular', 'prism', 'block']):
-        width = extract_dimension(prompt, 'width', 'wide', 'w')
-        height = extract_dimension(prompt, 'height', 'tall', 'h')
-        depth = extract_dimension(prompt, 'depth', 'deep', 'long', 'length', 'd', 'l')
-        
-        numbers = extract_all_numbers(prompt)
-        axb_match = re.search(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*x\s*(\d+\.?\d*)', prompt_lower)
-        
-        if axb_match:
-            unit = detect_units(prompt)
-            width = convert_to_meters(float(axb_match.group(1)), unit)
-            height = convert_to_meters(float(axb_match.group(2)), unit)
-            depth = convert_to_meters(float(axb_match.group(3)), unit)
-        elif len(numbers) >= 3:
-            width = width or numbers[0]
-            height = height or numbers[1]
-            depth = depth or numbers[2]
-        elif len(numbers) == 1:
-            width = height = depth = numbers[0]
-        
-        width = width or 0.02
-        height = height or 0.02
-        depth = depth or 0.02
-        return ParsedShape('box', {'width': width, 'height': height, 'depth': depth}, units)
-    
-    # --- HEXAGON ---
-    elif 'hexagon' in prompt_lower or 'hex' in prompt_lower:
-        radius = extract_dimension(prompt, 'radius', 'r', 'size')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not radius and numbers:
-            radius = numbers[0]
-        if not height and len(numbers) >= 2:
-            height = numbers[1]
-        
-        radius = radius or 0.01
-        height = height or 0.01
-        return ParsedShape('hexagon', {'radius': radius, 'height': height}, units, is_2d)
-    
-    # --- TRIANGLE ---
-    elif 'triangle' in prompt_lower:
-        base = extract_dimension(prompt, 'base', 'width', 'b', 'w')
-        tri_height = extract_dimension(prompt, 'height', 'tall', 'h')
-        depth = extract_dimension(prompt, 'depth', 'thick', 'extrude', 'd')
-        numbers = extract_all_numbers(prompt)
-        
-        if not base and numbers:
-            base = numbers[0]
-        if not tri_height and len(numbers) >= 2:
-            tri_height = numbers[1]
-        if not depth and len(numbers) >= 3:
-            depth = numbers[2]
-        
-        base = base or 0.02
-        tri_height = tri_height or 0.02
-        depth = depth or 0.01
-        return ParsedShape('triangle', {'base': base, 'tri_height': tri_height, 'depth': depth}, units, is_2d)
-    
-    # --- PENTAGON ---
-    elif 'pentagon' in prompt_lower:
-        radius = extract_dimension(prompt, 'radius', 'r', 'size')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not radius and numbers:
-            radius = numbers[0]
-        if not height and len(numbers) >= 2:
-            height = numbers[1]
-        
-        radius = radius or 0.01
-        height = height or 0.01
-        return ParsedShape('pentagon', {'radius': radius, 'height': height}, units, is_2d)
-    
-    # --- OCTAGON ---
-    elif 'octagon' in prompt_lower:
-        radius = extract_dimension(prompt, 'radius', 'r', 'size')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not radius and numbers:
-            radius = numbers[0]
-        if not height and len(numbers) >= 2:
-            height = numbers[1]
-        
-        radius = radius or 0.01
-        height = height or 0.01
-        return ParsedShape('octagon', {'radius': radius, 'height': height}, units, is_2d)
-    
-    # --- ELLIPSE / OVAL ---
-    elif any(word in prompt_lower for word in ['ellipse', 'oval']):
-        major = extract_dimension(prompt, 'major', 'length', 'long', 'a')
-        minor = extract_dimension(prompt, 'minor', 'width', 'short', 'b')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not major and numbers:
-            major = numbers[0]
-        if not minor and len(numbers) >= 2:
-            minor = numbers[1]
-        if not height and len(numbers) >= 3:
-            height = numbers[2]
-        
-        major = major or 0.02
-        minor = minor or 0.01
-        height = height or 0.01
-        return ParsedShape('ellipse', {'major': major, 'minor': minor, 'height': height}, units, is_2d)
-    
-    # --- CIRCLE (2D default, or 3D if extruded) ---
-    elif 'circle' in prompt_lower:
-        radius = extract_dimension(prompt, 'radius', 'r')
-        diameter = extract_dimension(prompt, 'diameter', 'dia', 'd')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick', 'extrude')
-        
-        if diameter and not radius:
-            radius = diameter / 2
-        if not radius:
-            numbers = extract_all_numbers(prompt)
-            radius = numbers[0] if numbers else 0.01
-        
-        radius = radius or 0.01
-        if height:
-            return ParsedShape('cylinder', {'radius': radius, 'height': height}, units)
-        return ParsedShape('circle', {'radius': radius}, units, is_2d=True)
-    
-    # --- SQUARE (2D) ---
-    elif 'square' in prompt_lower:
-        size = extract_dimension(prompt, 'side', 'size', 'length', 's')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick', 'extrude')
-        numbers = extract_all_numbers(prompt)
-        
-        if not size and numbers:
-            size = numbers[0]
-        
-        size = size or 0.02
-        if height:
-            return ParsedShape('cube', {'size': size}, units)
-        return ParsedShape('square', {'size': size}, units, is_2d=True)
-    
-    # --- RECTANGLE (2D) ---
-    elif 'rectangle' in prompt_lower or 'rect' in prompt_lower:
-        width = extract_dimension(prompt, 'width', 'wide', 'w')
-        length = extract_dimension(prompt, 'length', 'long', 'l', 'height', 'h')
-        depth = extract_dimension(prompt, 'depth', 'thick', 'extrude', 'd')
-        numbers = extract_all_numbers(prompt)
-        
-        axb_match = re.search(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)', prompt_lower)
-        if axb_match:
-            unit = detect_units(prompt)
-            width = convert_to_meters(float(axb_match.group(1)), unit)
-            length = convert_to_meters(float(axb_match.group(2)), unit)
-        elif len(numbers) >= 2:
-            width = width or numbers[0]
-            length = length or numbers[1]
-        
-        width = width or 0.02
-        length = length or 0.01
-        if depth:
-            return ParsedShape('box', {'width': width, 'height': depth, 'depth': length}, units)
-        return ParsedShape('rectangle', {'width': width, 'length': length}, units, is_2d=True)
-    
-    # --- SLOT ---
-    elif 'slot' in prompt_lower:
-        length = extract_dimension(prompt, 'length', 'long', 'l')
-        width = extract_dimension(prompt, 'width', 'wide', 'w')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not length and numbers:
-            length = numbers[0]
-        if not width and len(numbers) >= 2:
-            width = numbers[1]
-        if not height and len(numbers) >= 3:
-            height = numbers[2]
-        
-        length = length or 0.03
-        width = width or 0.01
-        height = height or 0.005
-        return ParsedShape('slot', {'length': length, 'width': width, 'height': height}, units, is_2d)
-    
-    # --- WASHER / RING ---
-    elif any(word in prompt_lower for word in ['washer', 'ring', 'donut', 'annulus']):
-        outer = extract_dimension(prompt, 'outer', 'outside', 'od', 'diameter')
-        inner = extract_dimension(prompt, 'inner', 'inside', 'id', 'hole')
-        height = extract_dimension(prompt, 'height', 'tall', 'h', 'thick')
-        numbers = extract_all_numbers(prompt)
-        
-        if not outer and numbers:
-            outer = numbers[0]
-        if not inner and len(numbers) >= 2:
-            inner = numbers[1]
-        if not height and len(numbers) >= 3:
-            height = numbers[2]
-        
-        outer = outer or 0.02
-        inner = inner or 0.01
-        height = height or 0.005
-        return ParsedShape('washer', {'outer': outer, 'inner': inner, 'height': height}, units, is_2d)
-    
-    # --- L-SHAPE ---
-    elif any(word in prompt_lower for word in ['l-shape', 'lshape', 'l shape']):
-        width = extract_dimension(prompt, 'width', 'w')
-        length = extract_dimension(prompt, 'length', 'l', 'height', 'h')
-        thickness = extract_dimension(prompt, 'thick', 't')
-        depth = extract_dimension(prompt, 'depth', 'd', 'extrude')
-        numbers = extract_all_numbers(prompt)
-        
-        if len(numbers) >= 1:
-            width = width or numbers[0]
-        if len(numbers) >= 2:
-            length = length or numbers[1]
-        if len(numbers) >= 3:
-            thickness = thickness or numbers[2]
-        if len(numbers) >= 4:
-            depth = depth or numbers[3]
-        
-        width = width or 0.02
-        length = length or 0.02
-        thickness = thickness or 0.003
-        depth = depth or 0.01
-        return ParsedShape('lshape', {'width': width, 'length': length, 'thickness': thickness, 'depth': depth}, units, is_2d)
-    
-    # --- CROSS / PLUS ---
-    elif any(word in prompt_lower for word in ['cross', 'plus']):
-        size = extract_dimension(prompt, 'size', 's', 'width', 'w')
-        thickness = extract_dimension(prompt, 'thick', 't', 'arm')
-        depth = extract_dimension(prompt, 'depth', 'd', 'height', 'h')
-        numbers = extract_all_numbers(prompt)
-        
-        if len(numbers) >= 1:
-            size = size or numbers[0]
-        if len(numbers) >= 2:
-            thickness = thickness or numbers[1]
-        if len(numbers) >= 3:
-            depth = depth or numbers[2]
-        
-        size = size or 0.02
-        thickness = thickness or 0.005
-        depth = depth or 0.005
-        return ParsedShape('cross', {'size': size, 'thickness': thickness, 'depth': depth}, units, is_2d)
-    
-    # --- STAR ---
-    elif 'star' in prompt_lower:
-        outer = extract_dimension(prompt, 'outer', 'radius', 'r', 'size')
-        inner = extract_dimension(prompt, 'inner')
-        points = 5
-        height = extract_dimension(prompt, 'height', 'h', 'thick', 'depth')
-        numbers = extract_all_numbers(prompt)
-        
-        points_match = re.search(r'(\d+)\s*point', prompt_lower)
-        if points_match:
-            points = int(points_match.group(1))
-        
-        if not outer and numbers:
-            outer = numbers[0]
-        if not height and len(numbers) >= 2:
-            height = numbers[1]
-        
-        outer = outer or 0.02
-        inner = inner or outer * 0.4
-        height = height or 0.005
-        return ParsedShape('star', {'outer': outer, 'inner': inner, 'points': points, 'height': height}, units, is_2d)
-    
-    return None
+    dims = parse_all_dimensions(prompt_lower, units)
+    return _SHAPE_PARSERS[shape](prompt_lower, dims, units, is_2d)
 
 
 # =============================================================================
 # SolidWorks Connection
 # =============================================================================
 
+def ask_template_path():
+    """Ask the user for a part template with a file dialog (Tk thread only)."""
+    return filedialog.askopenfilename(
+        title="Select SolidWorks Part Template",
+        filetypes=[("Part Template", "*.prtdot")],
+    )
+
+
 class SolidWorksApp:
-    def __init__(self):
+    def __init__(self, ask_template=ask_template_path):
+        # Called when no template is found; the GUI swaps in one that runs
+        # the dialog on the Tk thread, since connect() runs on its worker
+        self.ask_template = ask_template
         self.swApp = None
         self.model = None
         self.template_path = None
@@ -476,14 +661,27 @@ class SolidWorksApp:
         self.creator = None
 
     def connect(self):
+        # Prefer a running SolidworksServer: its creator stays connected to
+        # SolidWorks across GUI launches.
         try:
-            self.swApp = win32com.client.GetActiveObject("SldWorks.Application")
+            self.creator = connect_creator()
+            return True
+        except (OSError, EOFError, multiprocessing.AuthenticationError):
+            pass  # no usable server; connect to SolidWorks directly
+
+        try:
+            app = win32com.client.GetActiveObject("SldWorks.Application")
         except:
-            self.swApp = win32com.client.Dispatch("SldWorks.Application")
+            app = "SldWorks.Application"
+        # Early-bound through the makepy cache, so COM calls go straight to
+        # their DISPIDs instead of a GetIDsOfNames lookup on every call
+        self.swApp = win32com.client.gencache.EnsureDispatch(app)
 
         self.swApp.Visible = True
         self._nothing = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
-        self._find_template()
+        # Cached on disk per SolidWorks revision, so the search (and the
+        # file dialog) only runs on first start or after an upgrade
+        self.template_path = find_part_template(self.swApp, self.ask_template)
 
         # Set up the SolidWorksCreator for shapes that need it (e.g. sphere)
         self.creator = SolidWorksCreator()
@@ -493,37 +691,13 @@ class SolidWorksApp:
 
         return True
     
-    def _find_template(self):
-        try:
-            path = self.swApp.GetUserPreferenceStringValue(8)
-            if path and os.path.exists(path):
-                self.template_path = path
-                return
-        except:
-            pass
-        
-        common_paths = [
-            r"C:\ProgramData\SolidWorks\SOLIDWORKS 2025\templates\Part.prtdot",
-            r"C:\ProgramData\SolidWorks\SOLIDWORKS 2024\templates\Part.prtdot",
-            r"C:\ProgramData\SolidWorks\SOLIDWORKS 2023\templates\Part.prtdot",
-            r"C:\ProgramData\SolidWorks\SOLIDWORKS 2022\templates\Part.prtdot",
-            r"C:\ProgramData\SolidWorks\SOLIDWORKS 2021\templates\Part.prtdot",
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                self.template_path = path
-                return
-        
-        self.template_path = filedialog.askopenfilename(
-            title="Select SolidWorks Part Template",
-            filetypes=[("Part Template", "*.prtdot")],
-        )
-    
     def new_part(self):
-        self.model = self.swApp.NewDocument(self.template_path, 0, 0, 0)
-        if not self.model:
+        model = self.swApp.NewDocument(self.template_path, 0, 0, 0)
+        if not model:
             raise Exception("Failed to create new part")
+        # NewDocument returns a plain IDispatch; the cast makes the model and
+        # the managers it hands out (SketchManager, ...) early-bound too
+        self.model = win32com.client.CastTo(model, "IModelDoc2")
         return self.model
     
     def zoom_to_fit(self):
@@ -535,35 +709,73 @@ class SolidWorksApp:
 # Helper Functions
 # =============================================================================
 
+def _mm(*values):
+    """Format lengths in meters for messages: '12.5mm' or '10.0x20.0mm'."""
+    return 'x'.join([format(v * 1000, '.1f') for v in values]) + 'mm'
+
+
+@lru_cache(maxsize=None)
+def _unit_circle(count):
+    """(cos, sin) of count evenly spaced angles, starting straight down.
+
+    Depends only on the vertex count, so the table is built once per count
+    and draw_polygon/draw_star just scale and offset it. Each point is the
+    previous one rotated by a unit complex step: one cos/sin per table.
+    """
+    step = complex(math.cos(2 * math.pi / count), math.sin(2 * math.pi / count))
+    z = -1j
+    table = []
+    for _ in range(count):
+        table.append((z.real, z.imag))
+        z *= step
+    return tuple(table)
+
+
+def _draw_closed(skMgr, vertices):
+    """Draw lines joining each vertex to the next, closing the loop."""
+    x1, y1 = vertices[-1]
+    for x2, y2 in vertices:
+        skMgr.CreateLine(x1, y1, 0, x2, y2, 0)
+        x1, y1 = x2, y2
+
+
 def draw_polygon(skMgr, cx, cy, radius, sides):
     """Draw a regular polygon."""
-    points = []
-    for i in range(sides):
-        angle = 2 * math.pi * i / sides - math.pi / 2
-        x = cx + radius * math.cos(angle)
-        y = cy + radius * math.sin(angle)
-        points.append((x, y))
-    
-    for i in range(sides):
-        x1, y1 = points[i]
-        x2, y2 = points[(i + 1) % sides]
-        skMgr.CreateLine(x1, y1, 0, x2, y2, 0)
+    _draw_closed(skMgr, [(cx + radius * c, cy + radius * s)
+                         for c, s in _unit_circle(sides)])
+
+
+def draw_rectangle(skMgr, hx, hy):
+    """Draw a rectangle centered on the origin, in one COM call if possible."""
+    create_rectangle = getattr(skMgr, 'CreateCornerRectangle', None)
+    if create_rectangle is None:
+        _draw_closed(skMgr, [(-hx, -hy), (hx, -hy), (hx, hy), (-hx, hy)])
+    else:
+        create_rectangle(-hx, -hy, 0, hx, hy, 0)
+
+
+def draw_slot(skMgr, half_len, r):
+    """Draw a straight slot along X with arc centers at +/-half_len.
+
+    Uses CreateSketchSlot (SolidWorks 2014+) when available, otherwise two
+    lines and two arcs.
+    """
+    create_slot = getattr(skMgr, 'CreateSketchSlot', None)
+    if create_slot is not None:
+        # Straight slot, center-to-center length, no dimensions
+        create_slot(0, 0, 2 * r, -half_len, 0, 0, half_len, 0, 0, 0, 0, 0, 1, False)
+        return
+    skMgr.CreateLine(-half_len, r, 0, half_len, r, 0)
+    skMgr.CreateArc(half_len, 0, 0, half_len, r, 0, half_len, -r, 0, -1)
+    skMgr.CreateLine(half_len, -r, 0, -half_len, -r, 0)
+    skMgr.CreateArc(-half_len, 0, 0, -half_len, -r, 0, -half_len, r, 0, -1)
 
 
 def draw_star(skMgr, cx, cy, outer_r, inner_r, points):
     """Draw a star shape."""
-    vertices = []
-    for i in range(points * 2):
-        angle = math.pi * i / points - math.pi / 2
-        r = outer_r if i % 2 == 0 else inner_r
-        x = cx + r * math.cos(angle)
-        y = cy + r * math.sin(angle)
-        vertices.append((x, y))
-    
-    for i in range(len(vertices)):
-        x1, y1 = vertices[i]
-        x2, y2 = vertices[(i + 1) % len(vertices)]
-        skMgr.CreateLine(x1, y1, 0, x2, y2, 0)
+    radii = (outer_r, inner_r) * points
+    _draw_closed(skMgr, [(cx + r * c, cy + r * s)
+                         for r, (c, s) in zip(radii, _unit_circle(points * 2))])
 
 
 def extrude(featMgr, height):
@@ -589,7 +801,7 @@ def create_cylinder(sw, radius, height):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"Cylinder (r={radius*1000:.1f}mm, h={height*1000:.1f}mm)"
+    return f"Cylinder (r={_mm(radius)}, h={_mm(height)})"
 
 
 def create_cube(sw, size):
@@ -600,15 +812,11 @@ def create_box(sw, width, height, depth, name="Box"):
     model = sw.new_part()
     skMgr = model.SketchManager
     skMgr.InsertSketch(True)
-    hx, hy = width / 2, depth / 2
-    skMgr.CreateLine(-hx, -hy, 0, hx, -hy, 0)
-    skMgr.CreateLine(hx, -hy, 0, hx, hy, 0)
-    skMgr.CreateLine(hx, hy, 0, -hx, hy, 0)
-    skMgr.CreateLine(-hx, hy, 0, -hx, -hy, 0)
+    draw_rectangle(skMgr, width / 2, depth / 2)
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"{name} ({width*1000:.1f}x{height*1000:.1f}x{depth*1000:.1f}mm)"
+    return f"{name} ({_mm(width, height, depth)})"
 
 
 def create_polygon_3d(sw, radius, height, sides, name):
@@ -619,7 +827,7 @@ def create_polygon_3d(sw, radius, height, sides, name):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"{name} (r={radius*1000:.1f}mm, h={height*1000:.1f}mm)"
+    return f"{name} (r={_mm(radius)}, h={_mm(height)})"
 
 
 def create_triangle_3d(sw, base, tri_height, depth):
@@ -633,7 +841,7 @@ def create_triangle_3d(sw, base, tri_height, depth):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, depth)
     sw.zoom_to_fit()
-    return f"Triangle Prism (base={base*1000:.1f}mm)"
+    return f"Triangle Prism (base={_mm(base)})"
 
 
 def create_ellipse_3d(sw, major, minor, height):
@@ -644,23 +852,18 @@ def create_ellipse_3d(sw, major, minor, height):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"Ellipse ({major*1000:.1f}x{minor*1000:.1f}mm, h={height*1000:.1f}mm)"
+    return f"Ellipse ({_mm(major, minor)}, h={_mm(height)})"
 
 
 def create_slot_3d(sw, length, width, height):
     model = sw.new_part()
     skMgr = model.SketchManager
     skMgr.InsertSketch(True)
-    r = width / 2
-    half_len = (length - width) / 2
-    skMgr.CreateLine(-half_len, r, 0, half_len, r, 0)
-    skMgr.CreateArc(half_len, 0, 0, half_len, r, 0, half_len, -r, 0, -1)
-    skMgr.CreateLine(half_len, -r, 0, -half_len, -r, 0)
-    skMgr.CreateArc(-half_len, 0, 0, -half_len, -r, 0, -half_len, r, 0, -1)
+    draw_slot(skMgr, (length - width) / 2, width / 2)
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"Slot ({length*1000:.1f}x{width*1000:.1f}mm)"
+    return f"Slot ({_mm(length, width)})"
 
 
 def create_washer(sw, outer, inner, height):
@@ -672,7 +875,7 @@ def create_washer(sw, outer, inner, height):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"Washer (OD={outer*1000:.1f}mm, ID={inner*1000:.1f}mm)"
+    return f"Washer (OD={_mm(outer)}, ID={_mm(inner)})"
 
 
 def create_lshape(sw, width, length, thickness, depth):
@@ -688,7 +891,7 @@ def create_lshape(sw, width, length, thickness, depth):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, depth)
     sw.zoom_to_fit()
-    return f"L-Shape ({width*1000:.1f}x{length*1000:.1f}mm)"
+    return f"L-Shape ({_mm(width, length)})"
 
 
 def create_cross(sw, size, thickness, depth):
@@ -711,7 +914,7 @@ def create_cross(sw, size, thickness, depth):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, depth)
     sw.zoom_to_fit()
-    return f"Cross ({size*1000:.1f}mm)"
+    return f"Cross ({_mm(size)})"
 
 
 def create_star_3d(sw, outer, inner, points, height):
@@ -722,7 +925,7 @@ def create_star_3d(sw, outer, inner, points, height):
     skMgr.InsertSketch(True)
     extrude(model.FeatureManager, height)
     sw.zoom_to_fit()
-    return f"{points}-Point Star (r={outer*1000:.1f}mm)"
+    return f"{points}-Point Star (r={_mm(outer)})"
 
 
 # 2D Shapes
@@ -733,97 +936,85 @@ def create_circle_2d(sw, radius):
     skMgr.CreateCircle(0, 0, 0, radius, 0, 0)
     skMgr.InsertSketch(True)
     sw.zoom_to_fit()
-    return f"Circle 2D (r={radius*1000:.1f}mm)"
+    return f"Circle 2D (r={_mm(radius)})"
 
 
 def create_square_2d(sw, size):
     model = sw.new_part()
     skMgr = model.SketchManager
     skMgr.InsertSketch(True)
-    hs = size / 2
-    skMgr.CreateLine(-hs, -hs, 0, hs, -hs, 0)
-    skMgr.CreateLine(hs, -hs, 0, hs, hs, 0)
-    skMgr.CreateLine(hs, hs, 0, -hs, hs, 0)
-    skMgr.CreateLine(-hs, hs, 0, -hs, -hs, 0)
+    draw_rectangle(skMgr, size / 2, size / 2)
     skMgr.InsertSketch(True)
     sw.zoom_to_fit()
-    return f"Square 2D ({size*1000:.1f}mm)"
+    return f"Square 2D ({_mm(size)})"
 
 
 def create_rectangle_2d(sw, width, length):
     model = sw.new_part()
     skMgr = model.SketchManager
     skMgr.InsertSketch(True)
-    hw, hl = width / 2, length / 2
-    skMgr.CreateLine(-hw, -hl, 0, hw, -hl, 0)
-    skMgr.CreateLine(hw, -hl, 0, hw, hl, 0)
-    skMgr.CreateLine(hw, hl, 0, -hw, hl, 0)
-    skMgr.CreateLine(-hw, hl, 0, -hw, -hl, 0)
+    draw_rectangle(skMgr, width / 2, length / 2)
     skMgr.InsertSketch(True)
     sw.zoom_to_fit()
-    return f"Rectangle 2D ({width*1000:.1f}x{length*1000:.1f}mm)"
+    return f"Rectangle 2D ({_mm(width, length)})"
 
 
 # =============================================================================
 # Process Prompt
 # =============================================================================
 
-def _dispatch_shape(sw, parsed):
-    """Create a single shape via sw.creator and return its display name."""
-    c = sw.creator
-    p = parsed.params
-    t = parsed.shape_type
-
-    if t == 'plane':
-        return c.create_plane(p.get('height'))
-    elif t == 'sphere':
-        return c.create_sphere(p['radius'])
-    elif t == 'cylinder':
-        return c.create_cylinder(p['radius'], p['height'])
-    elif t == 'cube':
-        return c.create_cube(p['size'])
-    elif t == 'box':
-        return c.create_box(p['width'], p['height'], p['depth'])
-    elif t == 'hexagon':
-        if parsed.is_2d:
-            return c.create_polygon_2d(p['radius'], 6, "Hexagon")
-        return c.create_polygon_3d(p['radius'], p['height'], 6, "Hexagon")
-    elif t == 'triangle':
-        if parsed.is_2d:
-            return c.create_triangle_2d(p['base'], p['tri_height'])
-        return c.create_triangle_3d(p['base'], p['tri_height'], p['depth'])
-    elif t == 'pentagon':
-        if parsed.is_2d:
-            return c.create_polygon_2d(p['radius'], 5, "Pentagon")
-        return c.create_polygon_3d(p['radius'], p['height'], 5, "Pentagon")
-    elif t == 'octagon':
-        if parsed.is_2d:
-            return c.create_polygon_2d(p['radius'], 8, "Octagon")
-        return c.create_polygon_3d(p['radius'], p['height'], 8, "Octagon")
-    elif t == 'ellipse':
-        if parsed.is_2d:
-            return c.create_ellipse_2d(p['major'], p['minor'])
-        return c.create_ellipse_3d(p['major'], p['minor'], p['height'])
-    elif t == 'slot':
-        return c.create_slot_3d(p['length'], p['width'], p['height'])
-    elif t == 'washer':
-        return c.create_washer(p['outer'], p['inner'], p['height'])
-    elif t == 'lshape':
-        return c.create_lshape(p['width'], p['length'], p['thickness'], p['depth'])
-    elif t == 'cross':
-        return c.create_cross(p['size'], p['thickness'], p['depth'])
-    elif t == 'star':
-        if parsed.is_2d:
-            return c.create_star_2d(p['outer'], p.get('inner'), p['points'])
-        return c.create_star_3d(p['outer'], p.get('inner'), p['points'], p['height'])
-    elif t == 'circle':
-        return c.create_circle_2d(p['radius'])
-    elif t == 'square':
-        return c.create_square_2d(p['size'])
-    elif t == 'rectangle':
-        return c.create_rectangle_2d(p['width'], p['length'])
-    else:
-        raise ValueError(f"Shape '{t}' not implemented")
+def _polygon_spec(p, is_2d, sides, name):
+    """create_batch() op for a regular polygon, flat or extruded."""
+    if is_2d:
+        return dict(shape='polygon_2d', radius=p['radius'], sides=sides, name=name)
+    return dict(shape='polygon_3d', radius=p['radius'], height=p['height'], sides=sides, name=name)
+
+
+# ParsedShape.shape_type -> (params, is_2d) -> op for create_batch()
+_SHAPE_SPECS = {
+    'plane': lambda p, is_2d: dict(shape='plane', height=p.get('height')),
+    'sphere': lambda p, is_2d: dict(shape='sphere', radius=p['radius']),
+    'cylinder': lambda p, is_2d: dict(shape='cylinder', radius=p['radius'], height=p['height']),
+    'cube': lambda p, is_2d: dict(shape='cube', size=p['size']),
+    'box': lambda p, is_2d: dict(shape='box', width=p['width'], height=p['height'], depth=p['depth']),
+    'hexagon': lambda p, is_2d: _polygon_spec(p, is_2d, 6, "Hexagon"),
+    'triangle': lambda p, is_2d: (
+        dict(shape='triangle_2d', base=p['base'], tri_height=p['tri_height']) if is_2d else
+        dict(shape='triangle_3d', base=p['base'], tri_height=p['tri_height'], depth=p['depth'])),
+    'pentagon': lambda p, is_2d: _polygon_spec(p, is_2d, 5, "Pentagon"),
+    'octagon': lambda p, is_2d: _polygon_spec(p, is_2d, 8, "Octagon"),
+    'ellipse': lambda p, is_2d: (
+        dict(shape='ellipse_2d', major=p['major'], minor=p['minor']) if is_2d else
+        dict(shape='ellipse_3d', major=p['major'], minor=p['minor'], height=p['height'])),
+    'slot': lambda p, is_2d: dict(shape='slot_3d', length=p['length'], width=p['width'], height=p['height']),
+    'washer': lambda p, is_2d: dict(shape='washer', outer=p['outer'], inner=p['inner'], height=p['height']),
+    'lshape': lambda p, is_2d: dict(shape='lshape', width=p['width'], length=p['length'], thickness=p['thickness'], depth=p['depth']),
+    'cross': lambda p, is_2d: dict(shape='cross', size=p['size'], thickness=p['thickness'], depth=p['depth']),
+    'star': lambda p, is_2d: (
+        dict(shape='star_2d', outer=p['outer'], inner=p.get('inner'), points=p['points']) if is_2d else
+        dict(shape='star_3d', outer=p['outer'], inner=p.get('inner'), points=p['points'], height=p['height'])),
+    'circle': lambda p, is_2d: dict(shape='circle_2d', radius=p['radius']),
+    'square': lambda p, is_2d: dict(shape='square_2d', size=p['size']),
+    'rectangle': lambda p, is_2d: dict(shape='rectangle_2d', width=p['width'], length=p['length']),
+}
+
+
+def _shape_spec(parsed):
+    """Translate a ParsedShape into an op for SolidWorksCreator.create_batch()."""
+    make_spec = _SHAPE_SPECS.get(parsed.shape_type)
+    if make_spec is None:
+        raise ValueError(f"Shape '{parsed.shape_type}' not implemented")
+    return make_spec(parsed.params, parsed.is_2d)
+
+
+def _dispatch_shape(sw, parsed, start=None):
+    """Create a single shape via sw.creator and return its display name.
+
+    start is create_batch()'s placement mode; passing it instead of
+    calling reset()/begin_stack() first keeps the prompt one call, so a
+    shared server creator cannot interleave another client's prompt.
+    """
+    return sw.creator.create_batch([_shape_spec(parsed)], start)[0]
 
 
 def process_prompt(sw, prompt):
@@ -835,22 +1026,18 @@ def process_prompt(sw, prompt):
     try:
         # --- Stacking: "sphere on top of a cube" (single prompt) ---
         if isinstance(parsed.on_top_of, ParsedShape):
-            sw.creator.reset()
-            bottom_name = _dispatch_shape(sw, parsed.on_top_of)
-            sw.creator.begin_stack()
-            top_name = _dispatch_shape(sw, parsed)
+            bottom_name, top_name = sw.creator.create_batch(
+                [_shape_spec(parsed.on_top_of), _shape_spec(parsed)], 'new')
             return True, f"{top_name} on top of {bottom_name}"
 
         # --- Stacking follow-up: "put a sphere on top" ---
         if parsed.on_top_of is True:
-            sw.creator.begin_stack()
-            name = _dispatch_shape(sw, parsed)
+            name = _dispatch_shape(sw, parsed, 'stack')
             return True, f"{name} (stacked)"
 
         # --- On the plane: "sphere on the plane" ---
         if parsed.on_top_of == 'plane':
-            sw.creator.set_height_to_plane()
-            name = _dispatch_shape(sw, parsed)
+            name = _dispatch_shape(sw, parsed, 'plane')
             return True, f"{name} (on plane)"
 
         # --- Plane creation: additive, don't reset ---
@@ -859,8 +1046,7 @@ def process_prompt(sw, prompt):
             return True, name
 
         # --- Normal standalone shape ---
-        sw.creator.reset()
-        name = _dispatch_shape(sw, parsed)
+        name = _dispatch_shape(sw, parsed, 'new')
         return True, name
 
     except Exception as e:
@@ -871,7 +1057,16 @@ def process_prompt(sw, prompt):
 # GUI
 # =============================================================================
 
+# Four-pointed star on the floating button, as (dx, dy) from its center
+_STAR_OFFSETS = tuple(
+    (r * math.sin(i * math.pi / 4), -r * math.cos(i * math.pi / 4))
+    for i, r in enumerate((12, 5) * 4)
+)
+
+
 class FloatingButton(tk.Toplevel):
+    DRAG_FRAME_MS = 16
+
     def __init__(self, parent, on_click):
         super().__init__(parent)
         self.on_click = on_click
@@ -880,47 +1075,55 @@ class FloatingButton(tk.Toplevel):
         self.attributes('-topmost', True)
         self.configure(bg=self.bg_color)
         self.button_size = 56
-        self.geometry(f"{self.button_size}x{self.button_size}")
         self._position_bottom_right()
         self.canvas = tk.Canvas(self, width=self.button_size, height=self.button_size, highlightthickness=0, bg=self.bg_color)
         self.canvas.pack()
-        self._draw_button()
+        self._build_button()
         self.canvas.bind('<Button-1>', self._on_press)
         self.canvas.bind('<B1-Motion>', self._on_drag)
         self.canvas.bind('<ButtonRelease-1>', self._on_release)
         self.canvas.bind('<Enter>', lambda e: self._draw_button('#2563EB'))
         self.canvas.bind('<Leave>', lambda e: self._draw_button('#3B82F6'))
-        self._drag_data = {'x': 0, 'y': 0, 'dragging': False}
+        self._drag_x, self._drag_y, self._dragging = 0, 0, False
+        self._pending_geom = None
     
     def _position_bottom_right(self):
-        self.geometry(f"+{self.winfo_screenwidth() - self.button_size - 30}+{self.winfo_screenheight() - self.button_size - 80}")
+        # Size and position in one geometry call: one window manager request
+        size = self.button_size
+        self.geometry(f"{size}x{size}+{self.winfo_screenwidth() - size - 30}+{self.winfo_screenheight() - size - 80}")
     
-    def _draw_button(self, color='#3B82F6'):
-        self.canvas.delete('all')
+    def _build_button(self, color='#3B82F6'):
+        # Created once; hover/press only recolor the body (see _draw_button)
         self.canvas.create_rectangle(0, 0, self.button_size, self.button_size, fill=self.bg_color, outline='')
         self.canvas.create_oval(4, 6, self.button_size - 2, self.button_size, fill='#1a1a1a', outline='')
-        self.canvas.create_oval(2, 2, self.button_size - 4, self.button_size - 6, fill=color, outline='#2563EB', width=2)
+        self._body = self.canvas.create_oval(2, 2, self.button_size - 4, self.button_size - 6, fill=color, outline='#2563EB', width=2)
         cx, cy = self.button_size // 2, self.button_size // 2 - 2
-        pts = []
-        for i in range(8):
-            a = i * 45 * (3.14159 / 180)
-            r = 12 if i % 2 == 0 else 5
-            pts.extend([cx + r * math.sin(a), cy - r * math.cos(a)])
+        pts = [v for dx, dy in _STAR_OFFSETS for v in (cx + dx, cy + dy)]
         self.canvas.create_polygon(pts, fill='white', outline='')
+
+    def _draw_button(self, color='#3B82F6'):
+        self.canvas.itemconfigure(self._body, fill=color)
     
     def _on_press(self, e):
-        self._drag_data = {'x': e.x, 'y': e.y, 'dragging': False}
+        self._drag_x, self._drag_y, self._dragging = e.x, e.y, False
         self._draw_button('#1D4ED8')
     
     def _on_drag(self, e):
-        if abs(e.x - self._drag_data['x']) > 5 or abs(e.y - self._drag_data['y']) > 5:
-            self._drag_data['dragging'] = True
-        if self._drag_data['dragging']:
-            self.geometry(f"+{self.winfo_x() + e.x - self._drag_data['x']}+{self.winfo_y() + e.y - self._drag_data['y']}")
+        if abs(e.x - self._drag_x) > 5 or abs(e.y - self._drag_y) > 5:
+            self._dragging = True
+        if self._dragging:
+            # Coalesce motion events into at most one move per frame (~60 Hz)
+            if self._pending_geom is None:
+                self.after(self.DRAG_FRAME_MS, self._apply_geom)
+            self._pending_geom = f"+{self.winfo_x() + e.x - self._drag_x}+{self.winfo_y() + e.y - self._drag_y}"
+
+    def _apply_geom(self):
+        self.geometry(self._pending_geom)
+        self._pending_geom = None
     
     def _on_release(self, e):
         self._draw_button('#3B82F6')
-        if not self._drag_data['dragging']:
+        if not self._dragging:
             self.on_click()
 
 
@@ -930,10 +1133,9 @@ class PromptDialog(tk.Toplevel):
         self.on_submit = on_submit
         self.overrideredirect(True)
         self.attributes('-topmost', True)
-        self.geometry("420x200")
+        self.geometry(f"420x200+{self.winfo_screenwidth() - 450}+{self.winfo_screenheight() - 300}")
         self.configure(bg='#2D2D2D')
         self._create_widgets()
-        self.geometry(f"+{self.winfo_screenwidth() - 450}+{self.winfo_screenheight() - 300}")
         self.bind('<Escape>', lambda e: self.withdraw())
     
     def _create_widgets(self):
@@ -961,7 +1163,9 @@ class PromptDialog(tk.Toplevel):
         
         btn_frame = tk.Frame(main, bg='#2D2D2D')
         btn_frame.pack(fill='x')
-        self.status = tk.Label(btn_frame, text="", font=('Segoe UI', 9), fg='#4ADE80', bg='#2D2D2D', anchor='w')
+        # Fixed (minimal) requested width: the label just fills the space the
+        # buttons leave, so a new message never re-lays out the dialog
+        self.status = tk.Label(btn_frame, text="", width=1, font=('Segoe UI', 9), fg='#4ADE80', bg='#2D2D2D', anchor='w')
         self.status.pack(side='left', fill='x', expand=True)
         tk.Button(btn_frame, text="Cancel", font=('Segoe UI', 10), bg='#3C3C3C', fg='white', relief='flat', padx=16, pady=6, command=self.withdraw).pack(side='right', padx=(10,0))
         tk.Button(btn_frame, text="Create", font=('Segoe UI', 10, 'bold'), bg='#3B82F6', fg='white', relief='flat', padx=20, pady=6, command=self._submit).pack(side='right')
@@ -972,8 +1176,10 @@ class PromptDialog(tk.Toplevel):
             self.status.configure(text="Please enter a description", fg='#F87171')
             return
         self.status.configure(text="Creating...", fg='#4ADE80')
-        self.update()
-        self.on_submit(prompt)
+        # Paint the status without dispatching queued input (update() would
+        # run clicks/keys re-entrantly), then create from the event loop
+        self.update_idletasks()
+        self.after(0, lambda: self.on_submit(prompt))
     
     def show_status(self, msg, error=False):
         self.status.configure(text=msg, fg='#F87171' if error else '#4ADE80')
@@ -988,15 +1194,43 @@ class PromptDialog(tk.Toplevel):
         self.status.configure(text="")
 
 
+BANNER = """\
+==================================================
+  SolidWorks AI Prompt Tool
+==================================================
+
+3D: sphere, cube, box, cylinder, hexagon, triangle,
+    pentagon, octagon, ellipse, star, cross,
+    slot, washer, L-shape
+
+2D: circle, square, rectangle
+    (add '2d' or 'sketch' for 2D versions)
+
+Look for the BLUE BUTTON!"""
+
+
+class PromptJob(NamedTuple):
+    """Prompt queued for the COM worker thread.
+
+    callback(prompt, success, result) runs on the Tk thread with
+    process_prompt()'s return value.
+    """
+    prompt: str
+    callback: object
+
+
 class SolidWorksAIApp:
     def __init__(self):
         self.root = tk.Tk()
         self.root.withdraw()
-        self.sw = SolidWorksApp()
-        self.sw.connect()
+        self.sw = SolidWorksApp(ask_template=self._ask_template)
+        self._jobs = queue.Queue()
+        self._connected = threading.Event()
+        self._connect_error = None
         self.button = FloatingButton(self.root, self._toggle_dialog)
         self.dialog = PromptDialog(self.root, self._on_submit)
         self.dialog.withdraw()
+        threading.Thread(target=self._worker, daemon=True).start()
     
     def _toggle_dialog(self):
         if self.dialog.state() == 'withdrawn':
@@ -1004,24 +1238,78 @@ class SolidWorksAIApp:
         else:
             self.dialog.withdraw()
     
+    def _ask_template(self):
+        # Tk widgets may only be touched from the Tk thread, so the worker
+        # hands the file dialog to the event loop and waits for the answer
+        answer = queue.Queue(maxsize=1)
+
+        def ask():
+            path = ''
+            try:
+                path = ask_template_path()
+            finally:
+                answer.put(path)  # never leave the worker waiting
+
+        self.root.after(0, ask)
+        return answer.get()
+
     def _on_submit(self, prompt):
-        success, result = process_prompt(self.sw, prompt)
+        if self._connect_error:
+            self._deliver(prompt, False, self._connect_error)
+            return
+        self._jobs.put(PromptJob(prompt, self._deliver))
+        if not self._connected.is_set():
+            # The job waits in the queue until the worker has connected
+            self.dialog.show_status("Connecting to SolidWorks...")
+
+    def _worker(self):
+        # COM proxies belong to the apartment of the thread that created
+        # them, so this thread both connects and runs every prompt; the Tk
+        # thread stays free to repaint and drag while SolidWorks works
+        pythoncom.CoInitialize()
+        try:
+            try:
+                self.sw.connect()
+            except Exception as e:
+                self._connect_error = f"Could not connect to SolidWorks: {e}"
+                try:
+                    self.root.after(0, self._deliver, None, False, self._connect_error)
+                except RuntimeError:
+                    pass  # Tk not running; the next prompt reports the error
+            else:
+                self._connected.set()
+            while True:
+                job = self._jobs.get()
+                # Prompts queued before a failed connect still get an answer,
+                # and one bad prompt must not end the loop for the rest
+                if self._connect_error:
+                    success, result = False, self._connect_error
+                else:
+                    try:
+                        success, result = process_prompt(self.sw, job.prompt)
+                    except Exception as e:
+                        success, result = False, str(e)
+                try:
+                    self.root.after(0, job.callback, job.prompt, success, result)
+                except RuntimeError:
+                    return  # Tk has shut down; nobody is left to answer
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _deliver(self, prompt, success, result):
         if success:
+            # The entry stays editable while SolidWorks works, so only clear
+            # it if the user has not started typing the next prompt. clear()
+            # also blanks the status, so it has to run before show_status()
+            if self.dialog.entry.get().strip() == prompt:
+                self.dialog.clear()
             self.dialog.show_status(f"✓ {result}")
-            self.dialog.clear()
         else:
             self.dialog.show_status(f"✗ {result}", error=True)
     
     def run(self):
-        print("=" * 50)
-        print("  SolidWorks AI Prompt Tool")
-        print("=" * 50)
-        print("\n3D: sphere, cube, box, cylinder, hexagon, triangle,")
-        print("    pentagon, octagon, ellipse, star, cross,")
-        print("    slot, washer, L-shape")
-        print("\n2D: circle, square, rectangle")
-        print("    (add '2d' or 'sketch' for 2D versions)")
-        print("\nLook for the BLUE BUTTON!")
+        # One write for the whole banner; the worker is already connecting
+        print(BANNER, flush=True)
         self.root.mainloop()
 
 
@@ -0,0 +1,142 @@
+"""
+SolidWorks Shape Server - Persistent COM Client
+===============================================
+Keeps one connected SolidWorksCreator alive for the lifetime of the
+process, so the GUI and scripts skip COM start-up, the SolidWorks
+handshake and the template lookup on every launch. Clients reach it
+through a multiprocessing manager on localhost.
+
+Requirements:
+    - SolidWorks must be running
+    - pip install pywin32
+
+Usage:
+    python SolidworksServer.py          # start once and leave running
+
+    from SolidworksServer import connect_creator
+
+    sw = connect_creator()              # proxy to the shared creator
+    sw.create_cube(size=0.02)
+"""
+import sys
+import queue
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.managers import BaseManager
+
+
+ADDRESS = ('127.0.0.1', 50741)
+AUTHKEY = b'solidworks-prompt-app'
+
+_creator = None
+_creator_lock = threading.Lock()
+
+
+class _SerializedCreator:
+    """Forwards calls to a SolidWorksCreator one client at a time.
+
+    The manager serves every connection on its own thread, but a
+    creator's stacking state, plane cache and CommandInProgress window
+    only make sense for one COM sequence at a time, so each call holds
+    _creator_lock until it returns.
+
+    Only single calls are atomic: clients should send a whole prompt as
+    one create_batch(ops, start) call rather than reset()/begin_stack()
+    followed by create_batch(). All clients still share one stacking
+    state, so 'stack' builds on whichever part was made last, by any
+    client.
+    """
+
+    def __init__(self, creator):
+        self._creator = creator
+
+    def __dir__(self):
+        # The manager exposes whatever dir() lists, so advertise the
+        # creator's public methods rather than this wrapper's own
+        return [name for name in dir(self._creator) if not name.startswith('_')]
+
+    def __getattr__(self, name):
+        attr = getattr(self._creator, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with _creator_lock:
+                return attr(*args, **kwargs)
+        return call
+
+
+def _shared_creator():
+    """Return the process-wide creator, connecting on first use."""
+    global _creator
+    with _creator_lock:
+        if _creator is None:
+            # Imported here so that importing this module for
+            # connect_creator() does not load pythoncom
+            from SolidworksCreate import SolidWorksCreator
+            creator = SolidWorksCreator()
+            creator.connect()
+            _creator = _SerializedCreator(creator)
+    return _creator
+
+
+class SolidWorksManager(BaseManager):
+    """Manager exposing the shared SolidWorksCreator as `creator()`."""
+
+
+SolidWorksManager.register('creator', callable=_shared_creator)
+
+
+def serve():
+    """Connect to SolidWorks and serve creator proxies until interrupted."""
+    _shared_creator()  # connect up front so the first request is warm
+    manager = SolidWorksManager(address=ADDRESS, authkey=AUTHKEY)
+    server = manager.get_server()
+    print(f"SolidWorks shape server listening on {ADDRESS[0]}:{ADDRESS[1]}")
+    server.serve_forever()
+
+
+def connect_creator(timeout=5.0):
+    """Return a proxy to the server's SolidWorksCreator.
+
+    The handshake runs on a daemon thread, so a listener on ADDRESS that
+    accepts but never answers costs `timeout` seconds instead of a hang.
+    (Probing the port with a bare socket instead would not be safe: the
+    manager's accept thread dies on a connection that drops mid-handshake.)
+
+    Raises:
+        ConnectionRefusedError: If no server is running.
+        TimeoutError: If nothing answers within `timeout` seconds.
+        EOFError, AuthenticationError: If another program, or a server
+            with a different AUTHKEY, is listening on ADDRESS.
+    """
+    answer = queue.Queue(maxsize=1)
+
+    def attempt():
+        try:
+            manager = SolidWorksManager(address=ADDRESS, authkey=AUTHKEY)
+            manager.connect()
+            answer.put(manager.creator())
+        except AssertionError as e:
+            # Older Pythons assert on a malformed challenge from a
+            # listener that is not a manager at all
+            answer.put(AuthenticationError(f"Not a shape server: {e}"))
+        except BaseException as e:
+            answer.put(e)
+
+    threading.Thread(target=attempt, daemon=True).start()
+    try:
+        result = answer.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError(f"No answer from a shape server on {ADDRESS[0]}:{ADDRESS[1]}") from None
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+if __name__ == "__main__":
+    # The manager serves every client connection on its own thread, so the
+    # server joins the multithreaded apartment instead of pywin32's default
+    # STA. This must be set before pythoncom is first imported.
+    sys.coinit_flags = 0  # COINIT_MULTITHREADED
+    serve()
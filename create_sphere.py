@@ -18,21 +18,80 @@ import os
 import time
 import math
 
+from SolidworksCreate import find_part_template
+
+
+SW_DOC_PART = 1  # swDocumentTypes_e.swDocPART
+
+# Built once per process rather than on every create_sphere() call
+_NOTHING = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
+_TWO_PI = 2 * math.pi
+
+# SelectByID2 arguments: the sketch plane, and the revolve axis (mark=4)
+_SEL_FRONT = ("Front Plane", "PLANE", 0.0, 0.0, 0.0, False, 0, _NOTHING, 0)
+_SEL_AXIS = ("Line1@Sketch1", "EXTSKETCHSEGMENT", 0.0, 0.0, 0.0, False, 4, _NOTHING, 0)
+
+# Every FeatureRevolve2 argument for a solid 360 degree revolve.
+# IMPORTANT: Parameter order is Dir1Type, Dir2Type, Dir1Angle, Dir2Angle
+_REVOLVE_360 = (
+    True,               # SingleDir
+    True,               # IsSolid
+    False,              # IsThin
+    False,              # IsCut
+    False,              # ReverseDir
+    False,              # BothDirectionUpToSameEntity
+    0,                  # Dir1Type (swEndCondBlind)
+    0,                  # Dir2Type (swEndCondBlind)
+    _TWO_PI,            # Dir1Angle (360 degrees in radians)
+    0.0,                # Dir2Angle
+    False,              # OffsetReverse1
+    False,              # OffsetReverse2
+    0.0,                # OffsetDistance1
+    0.0,                # OffsetDistance2
+    0,                  # ThinType
+    0.0,                # ThinThickness1
+    0.0,                # ThinThickness2
+    True,               # Merge
+    True,               # UseFeatScope
+    True,               # UseAutoSelect
+)
+
 
 def get_solidworks():
-    """Connect to running SolidWorks instance."""
-    swApp = win32com.client.GetActiveObject("SldWorks.Application")
+    """Connect to running SolidWorks instance, early-bound.
+
+    The makepy wrapper calls methods by DISPID instead of resolving each
+    name through GetIDsOfNames on every call.
+    """
+    swApp = win32com.client.gencache.EnsureDispatch(
+        win32com.client.GetActiveObject("SldWorks.Application"))
     swApp.Visible = True
     return swApp
 
 
-def find_template():
-    """Find the SolidWorks part template."""
-    for year in ['2025', '2024', '2023', '2022', '2021', '2020']:
-        path = rf"C:\ProgramData\SolidWorks\SOLIDWORKS {year}\templates\Part.prtdot"
-        if os.path.exists(path):
-            return path
-    raise FileNotFoundError("Could not find SolidWorks part template")
+def find_template(swApp):
+    """Find the SolidWorks part template.
+
+    SWAI_TEMPLATE, if set, is used as is; otherwise the lookup is the same
+    as SolidWorksCreator's (see SolidworksCreate.find_part_template).
+    """
+    return os.environ.get('SWAI_TEMPLATE') or find_part_template(swApp)
+
+
+def active_blank_part(swApp):
+    """Return the active document if it is a new, untouched part, else None.
+
+    Building into it skips NewDocument, which reloads the part template
+    from disk. A part counts as blank when it has never been saved and has
+    no unsaved changes, e.g. the Part1 SolidWorks opens with.
+    """
+    model = swApp.ActiveDoc
+    if model is None:
+        return None
+    model = win32com.client.CastTo(model, "IModelDoc2")
+    if model.GetType() != SW_DOC_PART or model.GetPathName() or model.GetSaveFlag():
+        return None
+    return model
 
 
 def create_sphere(radius=0.01):
@@ -46,63 +105,67 @@ def create_sphere(radius=0.01):
         tuple: (model, feature) - the SolidWorks model and revolve feature
     """
     swApp = get_solidworks()
-    template = find_template()
-    nothing = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
-
-    # Create new part document
-    model = swApp.NewDocument(template, 0, 0, 0)
-    ext = model.Extension
-    skMgr = model.SketchManager
-    featMgr = model.FeatureManager
-
-    # Open sketch on Front Plane
-    ext.SelectByID2("Front Plane", "PLANE", 0, 0, 0, False, 0, nothing, 0)
-    skMgr.InsertSketch(True)
-
-    # Draw semicircle arc on the right side of the Y axis
-    # 3-point arc: start (top), end (bottom), midpoint (right)
-    skMgr.Create3PointArc(0, radius, 0, 0, -radius, 0, radius, 0, 0)
-
-    # Draw centerline along Y axis as the revolve axis
-    skMgr.CreateCenterLine(0, -radius, 0, 0, radius, 0)
-
-    # Close sketch
-    skMgr.InsertSketch(True)
-    time.sleep(0.3)
-
-    # Select the centerline as revolve axis (mark=4)
-    model.ClearSelection2(True)
-    ext.SelectByID2("Line1@Sketch1", "EXTSKETCHSEGMENT", 0, 0, 0, False, 4, nothing, 0)
-
-    # Create solid revolve feature (360 degrees)
-    # IMPORTANT: Parameter order is Dir1Type, Dir2Type, Dir1Angle, Dir2Angle
-    feat = featMgr.FeatureRevolve2(
-        True,               # SingleDir
-        True,               # IsSolid
-        False,              # IsThin
-        False,              # IsCut
-        False,              # ReverseDir
-        False,              # BothDirectionUpToSameEntity
-        0,                  # Dir1Type (swEndCondBlind)
-        0,                  # Dir2Type (swEndCondBlind)
-        2 * math.pi,        # Dir1Angle (360 degrees in radians)
-        0.0,                # Dir2Angle
-        False,              # OffsetReverse1
-        False,              # OffsetReverse2
-        0.0,                # OffsetDistance1
-        0.0,                # OffsetDistance2
-        0,                  # ThinType
-        0.0,                # ThinThickness1
-        0.0,                # ThinThickness2
-        True,               # Merge
-        True,               # UseFeatScope
-        True                # UseAutoSelect
-    )
-
-    if feat is None:
-        raise RuntimeError("FeatureRevolve2 returned None - sphere creation failed")
-
-    model.ForceRebuild3(True)
+    template = find_template(swApp)
+
+    # CommandInProgress stops SolidWorks refreshing after every call from
+    # this (out-of-process) script; the model is rebuilt once at the end
+    swApp.CommandInProgress = True
+    featMgr = view = None
+    try:
+        # Use the open blank part if there is one, else create a new one.
+        # NewDocument returns a plain IDispatch; cast it to stay early-bound
+        model = active_blank_part(swApp) or win32com.client.CastTo(
+            swApp.NewDocument(template, 0, 0, 0), "IModelDoc2")
+        ext = model.Extension
+        skMgr = model.SketchManager
+        featMgr = model.FeatureManager
+
+        # Freeze the FeatureManager tree and the graphics view as well,
+        # until the revolve is in
+        featMgr.EnableFeatureTree = False
+        view = model.ActiveView
+        view.EnableGraphicsUpdate = False
+
+        # Open sketch on Front Plane
+        ext.SelectByID2(*_SEL_FRONT)
+        skMgr.InsertSketch(True)
+
+        # Draw semicircle arc on the right side of the Y axis
+        # 3-point arc: start (top), end (bottom), midpoint (right)
+        skMgr.Create3PointArc(0, radius, 0, 0, -radius, 0, radius, 0, 0)
+
+        # Draw centerline along Y axis as the revolve axis
+        skMgr.CreateCenterLine(0, -radius, 0, 0, radius, 0)
+
+        # Close sketch
+        skMgr.InsertSketch(True)
+
+        # Select the centerline as revolve axis (mark=4). Instead of a fixed
+        # sleep, retry until SolidWorks has published the closed sketch,
+        # pumping messages so this STA thread does not hold it up
+        model.ClearSelection2(True)
+        for _ in range(30):
+            if ext.SelectByID2(*_SEL_AXIS):
+                break
+            pythoncom.PumpWaitingMessages()
+            time.sleep(0.01)
+        else:
+            raise RuntimeError("Could not select the revolve axis Line1@Sketch1")
+
+        # Create solid revolve feature (360 degrees)
+        feat = featMgr.FeatureRevolve2(*_REVOLVE_360)
+
+        if feat is None:
+            raise RuntimeError("FeatureRevolve2 returned None - sphere creation failed")
+    finally:
+        if view is not None:
+            view.EnableGraphicsUpdate = True
+        if featMgr is not None:
+            featMgr.EnableFeatureTree = True
+        swApp.CommandInProgress = False
+
+    model.EditRebuild3()
+    model.GraphicsRedraw2()
     model.ViewZoomtofit2()
 
     return model, feat
@@ -114,5 +177,5 @@ if __name__ == "__main__":
 
     print(f"Creating sphere with radius {radius_mm}mm...")
     model, feat = create_sphere(radius_m)
-    print(f"Feature: {feat.Name} ({feat.GetTypeName2})")
+    print(f"Feature: {feat.Name} ({feat.GetTypeName2()})")
     print("Sphere created successfully!")
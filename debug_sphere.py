@@ -1,29 +1,25 @@
 """
 Debug: Check what the thin-wall revolve actually creates.
-Also try GetBodies2 with all body type values.
-Also try creating a VBA macro and running it.
+Also list every body and its type with one GetBodies2 call.
 """
 import win32com.client
 import pythoncom
-import os
 import math
 import time
 
-swApp = win32com.client.GetActiveObject("SldWorks.Application")
+from create_sphere import find_template
+
+swApp = win32com.client.gencache.EnsureDispatch(
+    win32com.client.GetActiveObject("SldWorks.Application"))
 swApp.Visible = True
 
-template = None
-for year in ['2025', '2024', '2023', '2022', '2021']:
-    path = rf"C:\ProgramData\SolidWorks\SOLIDWORKS {year}\templates\Part.prtdot"
-    if os.path.exists(path):
-        template = path
-        break
+template = find_template(swApp)
 
 radius = 0.01
 nothing = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
 
 # Create model with thin wall revolve (the approach that works)
-model = swApp.NewDocument(template, 0, 0, 0)
+model = win32com.client.CastTo(swApp.NewDocument(template, 0, 0, 0), "IModelDoc2")
 ext = model.Extension
 skMgr = model.SketchManager
 featMgr = model.FeatureManager
@@ -33,10 +29,16 @@ skMgr.InsertSketch(True)
 skMgr.Create3PointArc(0, radius, 0, 0, -radius, 0, radius, 0, 0)
 skMgr.CreateCenterLine(0, -radius, 0, 0, radius, 0)
 skMgr.InsertSketch(True)
-time.sleep(0.3)
 
+# Poll the axis selection instead of sleeping a fixed 300 ms
 model.ClearSelection2(True)
-ext.SelectByID2("Line1@Sketch1", "EXTSKETCHSEGMENT", 0, 0, 0, False, 4, nothing, 0)
+for _ in range(30):
+    if ext.SelectByID2("Line1@Sketch1", "EXTSKETCHSEGMENT", 0, 0, 0, False, 4, nothing, 0):
+        break
+    pythoncom.PumpWaitingMessages()
+    time.sleep(0.01)
+else:
+    raise RuntimeError("Could not select the revolve axis Line1@Sketch1")
 
 feat = featMgr.FeatureRevolve2(
     True, False, True, False, False, False,
@@ -51,42 +53,45 @@ model.ForceRebuild3(True)
 # Check feature info
 if feat:
     print(f"Feature name: {feat.Name}")
-    print(f"Feature type: {feat.GetTypeName2}")
+    print(f"Feature type: {feat.GetTypeName2()}")
 
-# Check bodies with ALL type values
-print("\n--- GetBodies2 with different type values ---")
-for btype in range(-1, 6):
-    try:
-        bodies = model.GetBodies2(btype, False)
-        if bodies:
-            print(f"  Type {btype}: {len(bodies)} bodies")
-            for b in bodies:
-                print(f"    - {b.Name}")
-        else:
-            print(f"  Type {btype}: None/empty")
-    except Exception as e:
-        print(f"  Type {btype}: Error - {e}")
+# Fetch ALL bodies (swAllBodies = -1) in one call and classify them here,
+# instead of one GetBodies2 round trip per body type
+BODY_TYPES = {0: "solid", 1: "sheet", 2: "wire", 3: "minimum", 4: "general", 5: "empty"}
+print("\n--- GetBodies2(-1): all bodies ---")
+try:
+    # GetBodies2 lives on IPartDoc, not the IModelDoc2 the model is cast to
+    bodies = win32com.client.CastTo(model, "IPartDoc").GetBodies2(-1, False)
+    if bodies:
+        print(f"  {len(bodies)} bodies")
+        for b in bodies:
+            btype = b.GetType()
+            print(f"    - {b.Name} (type {btype}: {BODY_TYPES.get(btype, '?')})")
+    else:
+        print("  None/empty")
+except Exception as e:
+    print(f"  Error - {e}")
 
 # Check feature tree for body folders
 print("\n--- Feature tree ---")
-feat_iter = model.FirstFeature
-while feat_iter:
+# One GetFeatures call returns every top-level feature, instead of one
+# GetNextFeature round trip per link
+for feat_iter in featMgr.GetFeatures(True) or ():
     name = feat_iter.Name
-    typename = feat_iter.GetTypeName2
+    typename = feat_iter.GetTypeName2()
     print(f"  {name} ({typename})")
     # Check sub-features for body folders
     if "Body" in name:
-        subfeat = feat_iter.GetFirstSubFeature
+        subfeat = feat_iter.GetFirstSubFeature()
         while subfeat:
-            print(f"    -> {subfeat.Name} ({subfeat.GetTypeName2})")
-            subfeat = subfeat.GetNextSubFeature
-    feat_iter = feat_iter.GetNextFeature
+            print(f"    -> {subfeat.Name} ({subfeat.GetTypeName2()})")
+            subfeat = subfeat.GetNextSubFeature()
 
 # Try to get mass properties differently
 print("\n--- Mass properties attempts ---")
 try:
     # Create a MassProperty object
-    mp = ext.CreateMassProperty
+    mp = ext.CreateMassProperty()
     if mp:
         print(f"MassProperty object: {mp}")
         # Try to get volume
@@ -1,19 +1,16 @@
 """Quick test to find how to get the active sketch name."""
 import win32com.client
 import pythoncom
-import os
 
-swApp = win32com.client.GetActiveObject("SldWorks.Application")
+from create_sphere import find_template
+
+swApp = win32com.client.gencache.EnsureDispatch(
+    win32com.client.GetActiveObject("SldWorks.Application"))
 nothing = win32com.client.VARIANT(pythoncom.VT_DISPATCH, None)
 
-template = None
-for year in ['2025', '2024', '2023', '2022', '2021']:
-    path = rf"C:\ProgramData\SolidWorks\SOLIDWORKS {year}\templates\Part.prtdot"
-    if os.path.exists(path):
-        template = path
-        break
+template = find_template(swApp)
 
-model = swApp.NewDocument(template, 0, 0, 0)
+model = win32com.client.CastTo(swApp.NewDocument(template, 0, 0, 0), "IModelDoc2")
 ext = model.Extension
 skMgr = model.SketchManager
 
@@ -60,7 +57,5 @@ skMgr.InsertSketch(True)
 
 # List all features to see sketch names
 print("\nFeature tree:")
-feat = model.FirstFeature
-while feat:
-    print(f"  {feat.Name} ({feat.GetTypeName2})")
-    feat = feat.GetNextFeature
+for feat in model.FeatureManager.GetFeatures(True) or ():
+    print(f"  {feat.Name} ({feat.GetTypeName2()})")